@@ -9,8 +9,20 @@ __author__ = "ESKAI Team"
 __email__ = "kamyasamuel@eskaen.com"
 __license__ = "MIT"
 
-from .core.eskai_main import ESKAI
+from typing import TYPE_CHECKING, Any
+
 from .utils.config import ESKAIConfig
 from .utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from .core.eskai_main import ESKAI
+
 __all__ = ["ESKAI", "ESKAIConfig", "get_logger"]
+
+
+def __getattr__(name: str) -> Any:
+    # ESKAI pulls in every provider SDK, so it is only imported on first use
+    if name == "ESKAI":
+        from .core.eskai_main import ESKAI
+        return ESKAI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,21 +2,33 @@
 ESKAI Command Line Interface
 """
 
+import asyncio
 import click
-import json
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-from ..core.eskai_main import ESKAI
 from ..utils.config import ESKAIConfig
+from ..utils.serialization import dumps
+
+if TYPE_CHECKING:
+    from ..core.eskai_main import ESKAI
+
+
+def _install_uvloop() -> None:
+    """Use uvloop for the pipeline's event loops when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 
 @click.group()
 @click.version_option(version="0.1.1")
 def cli():
     """ESKAI - Evolved Strategic Knowledge and AI Framework"""
-    pass
+    _install_uvloop()
 
 
 @cli.command()
@@ -55,7 +67,8 @@ def process(
         eskai_config.log_level = "DEBUG"
     
     try:
-        # Initialize ESKAI
+        # Initialize ESKAI (imported here so lightweight commands skip provider SDKs)
+        from ..core.eskai_main import ESKAI
         agi = ESKAI(config=eskai_config)
         
         if interactive:
@@ -71,7 +84,7 @@ def process(
             # Output result
             if output:
                 with open(output, 'w') as f:
-                    json.dump(result, f, indent=2)
+                    f.write(dumps(result, indent=True))
                 click.echo(f"Results saved to {output}")
             else:
                 display_result(result)
@@ -84,7 +97,7 @@ def process(
         sys.exit(1)
 
 
-def run_interactive_mode(agi: ESKAI, max_time: int, enable_internet: bool, enable_code: bool):
+def run_interactive_mode(agi: "ESKAI", max_time: int, enable_internet: bool, enable_code: bool):
     """Run ESKAI in interactive mode."""
     click.echo("ESKAI Interactive Mode")
     click.echo("Type 'exit' to quit, 'help' for commands")
@@ -102,7 +115,7 @@ def run_interactive_mode(agi: ESKAI, max_time: int, enable_internet: bool, enabl
                 continue
             elif prompt.lower() == 'status':
                 status = agi.get_status()
-                click.echo(json.dumps(status, indent=2))
+                click.echo(dumps(status, indent=True))
                 continue
             
             click.echo("Processing...")
@@ -162,13 +175,15 @@ def show_help():
 
 
 @cli.command()
-def status():
+@click.option('--deep/--no-deep', default=True, help='Probe each provider API (no tokens are used)')
+def status(deep: bool):
     """Show ESKAI system status."""
     try:
+        from ..core.eskai_main import ESKAI
         config = ESKAIConfig()
         agi = ESKAI(config=config)
-        status = agi.get_status()
-        click.echo(json.dumps(status, indent=2))
+        status = agi.get_status(deep=deep)
+        click.echo(dumps(status, indent=True))
     except Exception as e:
         click.echo(f"Error getting status: {e}", err=True)
 
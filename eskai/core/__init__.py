@@ -2,6 +2,17 @@
 Core package initialization
 """
 
-from .eskai_main import ESKAI
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .eskai_main import ESKAI
 
 __all__ = ["ESKAI"]
+
+
+def __getattr__(name: str) -> Any:
+    # Defer the provider SDK imports until the framework is actually used
+    if name == "ESKAI":
+        from .eskai_main import ESKAI
+        return ESKAI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,7 +5,7 @@ Main ESKAI class - The core AGI framework implementation
 import asyncio
 import json
 import time
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 from datetime import datetime
 
 from ..utils.logger import get_logger
@@ -19,6 +19,15 @@ from .layer6 import ResultRenderer
 from ..providers.provider_manager import ProviderManager
 
 
+# Static instructions go in the system message so every chat request shares
+# an identical, provider-cacheable prefix.
+CHAT_SYSTEM_PROMPT = (
+    "You are ESKAI, a helpful AI assistant. "
+    "Provide a friendly, helpful response to the user's message. "
+    "Keep it conversational and natural."
+)
+
+
 class ESKAI:
     """
     Main ESKAI AGI Framework class.
@@ -56,17 +65,62 @@ class ESKAI:
         max_execution_time: Optional[int] = None,
         enable_internet: bool = True,
         enable_code_execution: bool = True,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        on_chunk: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Process a user prompt through the complete ESKAI pipeline.
         
+        Synchronous wrapper around process_async. It must not be called
+        from a running event loop; await process_async there instead.
+        
         Args:
             prompt: The user's input prompt
             max_execution_time: Maximum execution time in seconds
             enable_internet: Whether to enable internet access for agents
             enable_code_execution: Whether to enable code execution
             context: Optional context from previous interactions
+            on_chunk: Optional callback receiving the final synthesis text as
+                it streams from the provider
+            
+        Returns:
+            Dictionary containing the final result and execution metadata
+        """
+        return asyncio.run(
+            self.process_async(
+                prompt,
+                max_execution_time=max_execution_time,
+                enable_internet=enable_internet,
+                enable_code_execution=enable_code_execution,
+                context=context,
+                on_chunk=on_chunk
+            )
+        )
+    
+    async def process_async(
+        self,
+        prompt: str,
+        max_execution_time: Optional[int] = None,
+        enable_internet: bool = True,
+        enable_code_execution: bool = True,
+        context: Optional[Dict[str, Any]] = None,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous version of process method.
+        
+        Each layer is awaited in turn, so provider round-trips within a layer
+        (and speculative Layer 2 work) overlap instead of blocking a thread
+        for the whole pipeline.
+        
+        Args:
+            prompt: The user's input prompt
+            max_execution_time: Maximum execution time in seconds
+            enable_internet: Whether to enable internet access for agents
+            enable_code_execution: Whether to enable code execution
+            context: Optional context from previous interactions
+            on_chunk: Optional callback receiving the final synthesis text as
+                it streams from the provider
             
         Returns:
             Dictionary containing the final result and execution metadata
@@ -77,15 +131,22 @@ class ESKAI:
         self.logger.info(f"Starting ESKAI processing - ID: {execution_id}")
         self.logger.info(f"Prompt: {prompt[:100]}...")
         
+        speculative_objectives = None
+        
         try:
+            # Start objective formulation while intent is still being assessed
+            speculative_objectives = self._speculate_objectives(prompt, context)
+            
             # Layer 1: Prompt Assessment
             self.logger.info("Layer 1: Assessing prompt intent")
-            assessment = self.layer1.assess_intent(prompt, context)
+            assessment = await self.layer1.assess_intent_async(prompt, context)
             
             # If it's just chat, return simple response
             if assessment["intent"] == "chat":
+                if speculative_objectives is not None:
+                    speculative_objectives.cancel()
                 self.logger.info("Chat intent detected - generating simple response")
-                chat_response = self._generate_chat_response(prompt)
+                chat_response = await self._generate_chat_response_async(prompt)
                 return {
                     "type": "chat",
                     "response": chat_response,
@@ -95,7 +156,10 @@ class ESKAI:
             
             # Layer 2: Objective Formulation
             self.logger.info("Layer 2: Formulating objectives")
-            objectives = self.layer2.formulate_objectives(prompt, assessment, context)
+            if speculative_objectives is not None:
+                objectives = await speculative_objectives
+            else:
+                objectives = await self.layer2.formulate_objectives_async(prompt, assessment, context)
             
             # Layer 3: Work Plan Generation
             self.logger.info("Layer 3: Generating work plan")
@@ -111,20 +175,27 @@ class ESKAI:
             
             # Layer 5: Execution
             self.logger.info("Layer 5: Executing agents")
-            execution_results = self.layer5.execute_orchestration_plan(
+            execution_results = await self.layer5.execute_orchestration_plan_async(
                 orchestration,
                 max_execution_time=max_execution_time or self.config.default_timeout
             )
             
             # Layer 6: Final Result Rendering
             self.logger.info("Layer 6: Rendering final results")
-            final_result = self.layer6.render_final_result(
+            final_result = await self.layer6.render_final_result_async(
                 execution_results,
-                objectives
+                objectives,
+                on_chunk=on_chunk
             )
             
             processing_time = (datetime.now() - start_time).total_seconds()
             
+            # Agent results stay dataclasses internally; callers get plain dicts
+            execution_results["agent_results"] = {
+                agent_id: agent_result.to_dict()
+                for agent_id, agent_result in execution_results["agent_results"].items()
+            }
+            
             result = {
                 "type": "objective",
                 "execution_id": execution_id,
@@ -140,8 +211,10 @@ class ESKAI:
             return result
             
         except Exception as e:
+            if speculative_objectives is not None:
+                speculative_objectives.cancel()
             processing_time = (datetime.now() - start_time).total_seconds()
-            self.logger.error(f"ESKAI processing failed: {str(e)}")
+            self.logger.error(f"ESKAI processing failed: {e}")
             
             return {
                 "type": "error",
@@ -151,6 +224,44 @@ class ESKAI:
                 "success": False
             }
     
+    def _speculate_objectives(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]]
+    ) -> Optional[asyncio.Task]:
+        """
+        Start Layer 2 in the background when Layer 1 needs provider calls.
+        
+        Objective formulation does not depend on the assessment result, so
+        both layers' provider round-trips can overlap. Enabled by
+        config.speculative_objectives. This trades cost for latency: the
+        extraction calls (up to one per provider) are paid even when the
+        prompt turns out to be chat. Its result is then discarded, but
+        cancelling the task cannot stop calls already running in a worker
+        thread.
+        
+        Args:
+            prompt: The user's input prompt
+            context: Optional context from previous interactions
+            
+        Returns:
+            Task resolving to the objectives, or None if not speculating
+        """
+        if not self.config.speculative_objectives or not self.config.enable_parallel_execution:
+            return None
+        if self.config.combined_assessment:
+            # Layer 1's provider calls already extract the objectives
+            return None
+        if not self.layer1.needs_provider_assessment(prompt):
+            return None
+        
+        self.logger.info("Layer 2: Speculatively formulating objectives")
+        speculative_assessment = {"intent": "objective", "method": "speculative"}
+        
+        return asyncio.create_task(
+            self.layer2.formulate_objectives_async(prompt, speculative_assessment, context)
+        )
+    
     def _generate_chat_response(self, prompt: str) -> str:
         """
         Generate a simple chat response for conversational prompts.
@@ -165,51 +276,19 @@ class ESKAI:
             # Use primary provider for simple chat
             provider = self.provider_manager.get_primary_provider()
             
-            chat_prompt = f"""
-            You are ESKAI, a helpful AI assistant. The user said: "{prompt}"
-            
-            Provide a friendly, helpful response. Keep it conversational and natural.
-            """
-            
-            response = provider.generate_response(chat_prompt)
+            response = provider.generate_response(
+                prompt,
+                system_instruction=CHAT_SYSTEM_PROMPT
+            )
             return response
             
         except Exception as e:
-            self.logger.error(f"Chat response generation failed: {str(e)}")
+            self.logger.error(f"Chat response generation failed: {e}")
             return "Hello! I'm ESKAI, your AI assistant. How can I help you today?"
     
-    async def process_async(
-        self,
-        prompt: str,
-        max_execution_time: Optional[int] = None,
-        enable_internet: bool = True,
-        enable_code_execution: bool = True,
-        context: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """
-        Asynchronous version of process method.
-        
-        Args:
-            prompt: The user's input prompt
-            max_execution_time: Maximum execution time in seconds
-            enable_internet: Whether to enable internet access for agents
-            enable_code_execution: Whether to enable code execution
-            context: Optional context from previous interactions
-            
-        Returns:
-            Dictionary containing the final result and execution metadata
-        """
-        # Run the synchronous process method in a thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None,
-            self.process,
-            prompt,
-            max_execution_time,
-            enable_internet,
-            enable_code_execution,
-            context
-        )
+    async def _generate_chat_response_async(self, prompt: str) -> str:
+        """Asynchronous version of _generate_chat_response."""
+        return await asyncio.to_thread(self._generate_chat_response, prompt)
     
     def get_execution_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -225,17 +304,22 @@ class ESKAI:
         # For now, return empty list
         return []
     
-    def get_status(self) -> Dict[str, Any]:
+    def get_status(self, deep: bool = False) -> Dict[str, Any]:
         """
         Get the current status of the ESKAI framework.
         
+        Args:
+            deep: Whether to probe each provider's API instead of reporting
+                the outcome of recent requests
+        
         Returns:
             Dictionary containing status information
         """
         return {
             "version": "0.1.0",
             "status": "operational",
-            "providers": self.provider_manager.get_provider_status(),
+            "providers": self.provider_manager.get_provider_status(deep=deep),
+            "cache": self.provider_manager.get_cache_stats(),
             "config": {
                 "max_concurrent_agents": self.config.max_concurrent_agents,
                 "enable_parallel_execution": self.config.enable_parallel_execution,
@@ -3,9 +3,78 @@ Layer 1: Prompt Assessment
 Determines user intent and classifies prompts as chat or objective-driven.
 """
 
+import asyncio
+import copy
 import re
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Optional, List, Sequence
 from ..utils.logger import get_logger
+from ..utils.llm_cache import LLMCache
+from ..utils.serialization import extract_json_object, strip_code_fence
+from ..providers.provider_manager import PROVIDER_PRIORITY
+
+
+def _combine_patterns(patterns: Sequence[re.Pattern]) -> re.Pattern:
+    """
+    Fuse compiled patterns into a single alternation.
+    
+    Args:
+        patterns: Compiled patterns to combine
+        
+    Returns:
+        Pattern whose named group p<i> is set when patterns[i] matches
+    """
+    return re.compile("|".join(
+        f"(?=(?P<p{index}>{pattern.pattern}))" for index, pattern in enumerate(patterns)
+    ))
+
+
+# Fixed instructions come first so every assessment request shares the same
+# prefix; only the user input and context are filled in per call.
+ASSESSMENT_PROMPT_TEMPLATE = """Analyze the following user input and determine the intent. Classify it as either "chat" or "objective".
+
+Classification Criteria:
+- "chat": Casual conversation, greetings, simple questions, social pleasantries
+- "objective": Task requests, problem-solving, creation tasks, analysis requests, complex queries
+
+Respond in the following JSON format:
+{{
+    "intent": "chat" or "objective",
+    "confidence": 0.0 to 1.0,
+    "reasoning": "brief explanation of the classification"
+}}
+
+User Input: "{prompt}"{context_info}
+"""
+
+# Used when config.combined_assessment is set: the same request also extracts
+# objectives, so Layer 2 can reuse them instead of querying every provider again.
+COMBINED_ASSESSMENT_PROMPT_TEMPLATE = """Analyze the following user input and determine the intent. Classify it as either "chat" or "objective".
+If the intent is "objective", also extract clear, actionable objectives from it.
+
+Classification Criteria:
+- "chat": Casual conversation, greetings, simple questions, social pleasantries
+- "objective": Task requests, problem-solving, creation tasks, analysis requests, complex queries
+
+Respond in the following JSON format:
+{{
+    "intent": "chat" or "objective",
+    "confidence": 0.0 to 1.0,
+    "reasoning": "brief explanation of the classification",
+    "primary_objectives": ["main goals, empty for chat"],
+    "secondary_objectives": ["supporting goals"],
+    "expected_outcomes": ["what should be achieved"],
+    "constraints": ["limitations or requirements"]
+}}
+
+User Input: "{prompt}"{context_info}
+"""
+
+
+# Reasoning of provider results that did not come from a parsed JSON reply
+FALLBACK_PARSING_REASONING = "Fallback parsing"
+PARSING_FAILED_REASONING = "Parsing failed"
+DEGRADED_REASONINGS = frozenset((FALLBACK_PARSING_REASONING, PARSING_FAILED_REASONING))
 
 
 class PromptAssessor:
@@ -13,28 +82,53 @@ class PromptAssessor:
     Assesses user prompts to determine intent and processing requirements.
     """
     
-    def __init__(self, provider_manager, config):
-        self.provider_manager = provider_manager
-        self.config = config
-        self.logger = get_logger("PromptAssessor", level=config.log_level)
-        
-        # Predefined patterns for quick classification
-        self.chat_patterns = [
+    # Quick assessments above this confidence skip the provider round-trips
+    QUICK_CONFIDENCE_THRESHOLD = 0.8
+    
+    # Provider assessments stop once one intent leads by this many votes with
+    # this much combined confidence
+    EARLY_CONSENSUS_MARGIN = 2
+    EARLY_CONSENSUS_CONFIDENCE = 1.6
+    
+    # Number of provider-backed assessments kept for repeated prompts
+    ASSESSMENT_CACHE_SIZE = 1024
+    
+    # Predefined patterns for quick classification, compiled once at import and
+    # shared by every instance. They are matched against the lowercased prompt,
+    # so they are written in lowercase and compiled without re.IGNORECASE.
+    chat_patterns = tuple(
+        re.compile(pattern) for pattern in (
             r'\b(hello|hi|hey|good morning|good afternoon|good evening)\b',
             r'\b(how are you|what\'s up|how\'s it going)\b',
             r'\b(thanks|thank you|bye|goodbye|see you)\b',
             r'\b(nice|great|awesome|cool|interesting)\b$',
             r'^\s*(yes|no|ok|okay|sure|alright)\s*$'
-        ]
-        
-        self.objective_patterns = [
+        )
+    )
+    
+    objective_patterns = tuple(
+        re.compile(pattern) for pattern in (
             r'\b(create|build|make|develop|design|implement)\b',
             r'\b(analyze|research|investigate|study|examine)\b',
             r'\b(solve|fix|resolve|address|handle)\b',
             r'\b(generate|produce|write|compose|draft)\b',
             r'\b(plan|strategy|approach|method|solution)\b',
-            r'\b(help me|can you|please|I need)\b.*\b(with|to|for)\b'
-        ]
+            r'\b(help me|can you|please|i need)\b.*\b(with|to|for)\b'
+        )
+    )
+    
+    # Each group fused into one alternation so a prompt is scanned once per
+    # group. Every pattern sits in its own named lookahead, so overlapping
+    # matches are all seen and the score is still the number of distinct
+    # patterns that match.
+    _chat_re = _combine_patterns(chat_patterns)
+    _objective_re = _combine_patterns(objective_patterns)
+    
+    def __init__(self, provider_manager, config):
+        self.provider_manager = provider_manager
+        self.config = config
+        self.logger = get_logger("PromptAssessor", level=config.log_level)
+        self._assessment_cache = LLMCache(self.ASSESSMENT_CACHE_SIZE) if config.cache_responses else None
     
     def assess_intent(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -52,10 +146,21 @@ class PromptAssessor:
         # Quick pattern matching first
         quick_assessment = self._quick_pattern_match(prompt)
         
-        if quick_assessment["confidence"] > 0.8:
-            self.logger.info(f"High confidence quick assessment: {quick_assessment['intent']}")
+        if quick_assessment["confidence"] > self.QUICK_CONFIDENCE_THRESHOLD:
+            self.logger.info("High confidence quick assessment: %s", quick_assessment["intent"])
             return quick_assessment
         
+        # Reuse the consensus for a prompt that has already been assessed
+        cache_key = None
+        if self._assessment_cache is not None:
+            cache_key = LLMCache.make_key(
+                "intent_assessment", prompt, context_summary=context.get("summary") if context else None
+            )
+            cached_assessment = self._assessment_cache.get(cache_key)
+            if cached_assessment is not None:
+                self.logger.info("Cached intent assessment: %s", cached_assessment["intent"])
+                return copy.deepcopy(cached_assessment)
+        
         # Multi-provider assessment for uncertain cases
         self.logger.info("Running multi-provider intent assessment")
         provider_results = self._multi_provider_assessment(prompt, context)
@@ -63,10 +168,50 @@ class PromptAssessor:
         # Consensus decision
         final_assessment = self._consensus_decision(provider_results, quick_assessment)
         
-        self.logger.info(f"Final intent assessment: {final_assessment['intent']} (confidence: {final_assessment['confidence']:.2f})")
+        self.logger.info(
+            "Final intent assessment: %s (confidence: %.2f)",
+            final_assessment["intent"],
+            final_assessment["confidence"]
+        )
+        
+        # Assessments built only from unparseable replies are not reused,
+        # so a provider outage does not outlive its recovery
+        parsed_results = [r for r in provider_results if r["reasoning"] not in DEGRADED_REASONINGS]
+        if cache_key is not None and self._assessment_cache is not None and parsed_results:
+            self._assessment_cache.set(cache_key, copy.deepcopy(final_assessment))
         
         return final_assessment
     
+    async def assess_intent_async(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous version of assess_intent.
+        
+        Args:
+            prompt: The user's input prompt
+            context: Optional context from previous interactions
+            
+        Returns:
+            Dictionary containing intent classification and metadata
+        """
+        return await asyncio.to_thread(self.assess_intent, prompt, context)
+    
+    def needs_provider_assessment(self, prompt: str) -> bool:
+        """
+        Check whether classifying a prompt will require provider calls.
+        
+        Args:
+            prompt: The user's input prompt
+            
+        Returns:
+            True if the quick pattern match is not confident enough on its own
+        """
+        confidence: float = self._quick_pattern_match(prompt)["confidence"]
+        return confidence <= self.QUICK_CONFIDENCE_THRESHOLD
+    
     def _quick_pattern_match(self, prompt: str) -> Dict[str, Any]:
         """
         Quick pattern-based classification.
@@ -79,22 +224,14 @@ class PromptAssessor:
         """
         prompt_lower = prompt.lower().strip()
         
-        # Check for chat patterns
-        chat_score = 0
-        for pattern in self.chat_patterns:
-            if re.search(pattern, prompt_lower, re.IGNORECASE):
-                chat_score += 1
-        
-        # Check for objective patterns
-        objective_score = 0
-        for pattern in self.objective_patterns:
-            if re.search(pattern, prompt_lower, re.IGNORECASE):
-                objective_score += 1
+        # Check for chat and objective patterns
+        chat_score = self._count_matching_patterns(self._chat_re, prompt_lower)
+        objective_score = self._count_matching_patterns(self._objective_re, prompt_lower)
         
         # Length and complexity heuristics
         word_count = len(prompt.split())
         has_question_mark = '?' in prompt
-        has_complex_structure = len(prompt.split('.')) > 2 or len(prompt.split(',')) > 3
+        has_complex_structure = prompt.count('.') > 1 or prompt.count(',') > 2
         
         # Adjust scores based on heuristics
         if word_count > 20 or has_complex_structure:
@@ -124,6 +261,20 @@ class PromptAssessor:
             "method": "quick_pattern"
         }
     
+    @staticmethod
+    def _count_matching_patterns(combined: re.Pattern, text: str) -> int:
+        """
+        Count how many of the fused patterns match somewhere in the text.
+        
+        Args:
+            combined: Pattern built by _combine_patterns
+            text: Text to scan
+            
+        Returns:
+            Number of distinct patterns with at least one match
+        """
+        return len({match.lastgroup for match in combined.finditer(text)})
+    
     def _multi_provider_assessment(self, prompt: str, context: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Get intent assessment from multiple AI providers.
@@ -138,24 +289,80 @@ class PromptAssessor:
         assessment_prompt = self._build_assessment_prompt(prompt, context)
         provider_results = []
         
-        for provider_name in ["openai", "groq", "gemini"]:
-            try:
-                provider = self.provider_manager.get_provider(provider_name)
-                if provider:
-                    result = provider.generate_response(
-                        assessment_prompt,
-                        temperature=0.1  # Low temperature for consistent classification
-                    )
-                    
-                    parsed_result = self._parse_provider_response(result, provider_name)
-                    provider_results.append(parsed_result)
-                    
-            except Exception as e:
-                self.logger.warning(f"Provider {provider_name} failed for intent assessment: {str(e)}")
-                continue
+        # Query providers concurrently and stop as soon as the answer is settled
+        max_workers = len(PROVIDER_PRIORITY) if self.config.enable_parallel_execution else 1
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {
+            executor.submit(self._call_provider, provider_name, assessment_prompt): provider_name
+            for provider_name in PROVIDER_PRIORITY
+        }
+        
+        try:
+            for future in as_completed(futures):
+                provider_name = futures[future]
+                try:
+                    parsed_result = future.result()
+                    if parsed_result:
+                        provider_results.append(parsed_result)
+                        
+                except Exception as e:
+                    self.logger.warning("Provider %s failed for intent assessment: %s", provider_name, e)
+                    continue
+                
+                if self._providers_agree(provider_results):
+                    self.logger.info("Providers agree on intent, skipping remaining assessments")
+                    break
+        finally:
+            # Queued calls are dropped; in-flight ones finish in the background
+            executor.shutdown(wait=False, cancel_futures=True)
         
+        # Keep results in priority order regardless of completion order
+        provider_results.sort(key=lambda result: PROVIDER_PRIORITY.index(result["provider"]))
         return provider_results
     
+    def _providers_agree(self, provider_results: List[Dict[str, Any]]) -> bool:
+        """
+        Check whether the provider results so far already decide the intent.
+        
+        Args:
+            provider_results: Provider assessments received so far
+            
+        Returns:
+            True if one intent leads by EARLY_CONSENSUS_MARGIN votes with at
+            least EARLY_CONSENSUS_CONFIDENCE combined confidence
+        """
+        for intent in ("chat", "objective"):
+            votes = [r for r in provider_results if r["intent"] == intent]
+            margin = 2 * len(votes) - len(provider_results)
+            
+            if (margin >= self.EARLY_CONSENSUS_MARGIN and
+                    sum(r["confidence"] for r in votes) >= self.EARLY_CONSENSUS_CONFIDENCE):
+                return True
+        
+        return False
+    
+    def _call_provider(self, provider_name: str, assessment_prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Get intent assessment from a single provider.
+        
+        Args:
+            provider_name: Name of the provider
+            assessment_prompt: Prompt built by _build_assessment_prompt
+            
+        Returns:
+            Parsed assessment result, or None if the provider is unavailable
+        """
+        provider = self.provider_manager.get_provider(provider_name)
+        if not provider:
+            return None
+        
+        result = provider.generate_response(
+            assessment_prompt,
+            temperature=0.1  # Low temperature for consistent classification
+        )
+        
+        return self._parse_provider_response(result, provider_name)
+    
     def _build_assessment_prompt(self, prompt: str, context: Optional[Dict[str, Any]]) -> str:
         """
         Build the prompt for provider-based intent assessment.
@@ -171,25 +378,10 @@ class PromptAssessor:
         if context:
             context_info = f"\nPrevious context: {context.get('summary', 'None')}"
         
-        assessment_prompt = f"""
-        Analyze the following user input and determine the intent. Classify it as either "chat" or "objective".
-
-        User Input: "{prompt}"
-        {context_info}
-
-        Classification Criteria:
-        - "chat": Casual conversation, greetings, simple questions, social pleasantries
-        - "objective": Task requests, problem-solving, creation tasks, analysis requests, complex queries
-
-        Respond in the following JSON format:
-        {{
-            "intent": "chat" or "objective",
-            "confidence": 0.0 to 1.0,
-            "reasoning": "brief explanation of the classification"
-        }}
-        """
+        if self.config.combined_assessment:
+            return COMBINED_ASSESSMENT_PROMPT_TEMPLATE.format(prompt=prompt, context_info=context_info)
         
-        return assessment_prompt
+        return ASSESSMENT_PROMPT_TEMPLATE.format(prompt=prompt, context_info=context_info)
     
     def _parse_provider_response(self, response: str, provider_name: str) -> Dict[str, Any]:
         """
@@ -203,23 +395,28 @@ class PromptAssessor:
             Parsed assessment result
         """
         try:
-            # Try to extract JSON from response
-            import json
-            
-            # Look for JSON content
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
+            # Try to extract JSON from response, preferring a fenced block
+            result = extract_json_object(strip_code_fence(response))
             
-            if start_idx >= 0 and end_idx > start_idx:
-                json_str = response[start_idx:end_idx]
-                result = json.loads(json_str)
-                
-                return {
+            if result is not None:
+                parsed_result = {
                     "intent": result.get("intent", "objective"),
                     "confidence": float(result.get("confidence", 0.5)),
                     "reasoning": result.get("reasoning", "Provider assessment"),
                     "provider": provider_name
                 }
+                
+                # Objectives from a combined assessment, in Layer 2's candidate format
+                if result.get("primary_objectives"):
+                    parsed_result["objective_candidate"] = {
+                        "primary_objectives": result.get("primary_objectives", []),
+                        "secondary_objectives": result.get("secondary_objectives", []),
+                        "expected_outcomes": result.get("expected_outcomes", []),
+                        "constraints": result.get("constraints", []),
+                        "provider": provider_name
+                    }
+                
+                return parsed_result
             else:
                 # Fallback parsing
                 response_lower = response.lower()
@@ -233,16 +430,16 @@ class PromptAssessor:
                 return {
                     "intent": intent,
                     "confidence": confidence,
-                    "reasoning": "Fallback parsing",
+                    "reasoning": FALLBACK_PARSING_REASONING,
                     "provider": provider_name
                 }
                 
         except Exception as e:
-            self.logger.warning(f"Failed to parse response from {provider_name}: {str(e)}")
+            self.logger.warning("Failed to parse response from %s: %s", provider_name, e)
             return {
                 "intent": "objective",  # Safe default
                 "confidence": 0.3,
-                "reasoning": "Parsing failed",
+                "reasoning": PARSING_FAILED_REASONING,
                 "provider": provider_name
             }
     
@@ -259,34 +456,39 @@ class PromptAssessor:
         """
         all_results = provider_results + [quick_assessment]
         
-        # Count votes
-        chat_votes = sum(1 for r in all_results if r["intent"] == "chat")
-        objective_votes = sum(1 for r in all_results if r["intent"] == "objective")
+        result_count = len(all_results)
         
-        # Calculate weighted confidence
-        chat_confidence = sum(r["confidence"] for r in all_results if r["intent"] == "chat")
-        objective_confidence = sum(r["confidence"] for r in all_results if r["intent"] == "objective")
+        # Count votes and weighted confidence in a single pass
+        chat_votes = objective_votes = 0
+        chat_confidence = objective_confidence = 0.0
+        for r in all_results:
+            if r["intent"] == "chat":
+                chat_votes += 1
+                chat_confidence += r["confidence"]
+            elif r["intent"] == "objective":
+                objective_votes += 1
+                objective_confidence += r["confidence"]
         
         if chat_votes > objective_votes:
             intent = "chat"
-            confidence = min(0.95, chat_confidence / len(all_results))
+            confidence = min(0.95, chat_confidence / result_count)
         elif objective_votes > chat_votes:
             intent = "objective"
-            confidence = min(0.95, objective_confidence / len(all_results))
+            confidence = min(0.95, objective_confidence / result_count)
         else:
             # Tie - use confidence scores
             if chat_confidence > objective_confidence:
                 intent = "chat"
-                confidence = min(0.8, chat_confidence / len(all_results))
+                confidence = min(0.8, chat_confidence / result_count)
             else:
                 intent = "objective"
-                confidence = min(0.8, objective_confidence / len(all_results))
+                confidence = min(0.8, objective_confidence / result_count)
         
         # Compile reasoning
         provider_intents = [f"{r.get('provider', 'pattern')}: {r['intent']}" for r in all_results]
-        reasoning = f"Consensus from {len(all_results)} assessments: {', '.join(provider_intents)}"
+        reasoning = f"Consensus from {result_count} assessments: {', '.join(provider_intents)}"
         
-        return {
+        consensus = {
             "intent": intent,
             "confidence": confidence,
             "reasoning": reasoning,
@@ -294,3 +496,9 @@ class PromptAssessor:
             "provider_results": provider_results,
             "quick_assessment": quick_assessment
         }
+        
+        objective_candidates = [r["objective_candidate"] for r in provider_results if "objective_candidate" in r]
+        if objective_candidates:
+            consensus["objective_candidates"] = objective_candidates
+        
+        return consensus
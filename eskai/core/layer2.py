@@ -3,9 +3,18 @@ Layer 2: Objective Formulation
 Extracts clear, actionable objectives from user input and defines expected outcomes.
 """
 
-import json
-from typing import Dict, Any, Optional, List
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 from ..utils.logger import get_logger
+from ..utils.llm_cache import LLMCache
+from ..utils.serialization import extract_json_object, strip_code_fence
+from ..providers.provider_manager import PROVIDER_PRIORITY
+
+
+# Line prefixes treated as list items when falling back to text extraction
+BULLET_PREFIXES = ('-', '*', '1.')
 
 
 class ObjectiveFormulator:
@@ -13,10 +22,17 @@ class ObjectiveFormulator:
     Formulates clear objectives from user prompts using multi-provider validation.
     """
     
+    # Number of formulated objective sets kept for repeated prompts
+    OBJECTIVE_CACHE_SIZE = 1024
+    
+    # Objectives whose word sets are more similar than this are duplicates
+    SIMILARITY_THRESHOLD = 0.8
+    
     def __init__(self, provider_manager, config):
         self.provider_manager = provider_manager
         self.config = config
         self.logger = get_logger("ObjectiveFormulator", level=config.log_level)
+        self._objective_cache = LLMCache(self.OBJECTIVE_CACHE_SIZE) if config.cache_responses else None
     
     def formulate_objectives(
         self,
@@ -37,19 +53,24 @@ class ObjectiveFormulator:
         """
         self.logger.info("Formulating objectives from user prompt")
         
-        # Multi-provider objective extraction
-        objective_candidates = []
-        
-        for provider_name in ["openai", "groq", "gemini"]:
-            provider = self.provider_manager.get_provider(provider_name)
-            if provider:
-                try:
-                    result = provider.extract_objectives(prompt)
-                    parsed_result = self._parse_objectives(result, provider_name)
-                    objective_candidates.append(parsed_result)
-                except Exception as e:
-                    self.logger.warning(f"Provider {provider_name} failed for objective extraction: {str(e)}")
-                    continue
+        # Reuse the objectives of a prompt that has already been formulated
+        cache_key = None
+        if self._objective_cache is not None:
+            cache_key = LLMCache.make_key(
+                "objective_formulation", prompt, context_summary=context.get("summary") if context else None
+            )
+            cached_objectives = self._objective_cache.get(cache_key)
+            if cached_objectives is not None:
+                self.logger.info("Using cached objectives")
+                return copy.deepcopy(cached_objectives)
+        
+        # Objectives already extracted by a combined Layer 1 assessment
+        objective_candidates = list(assessment.get("objective_candidates", []))
+        
+        if objective_candidates:
+            self.logger.info("Reusing %d objective candidates from intent assessment", len(objective_candidates))
+        else:
+            objective_candidates = self._extract_candidates(prompt)
         
         # Synthesize objectives
         synthesized_objectives = self._synthesize_objectives(objective_candidates)
@@ -60,10 +81,95 @@ class ObjectiveFormulator:
         # Generate expected outcomes and success criteria
         final_objectives = self._enhance_objectives(critiqued_objectives, prompt, context)
         
-        self.logger.info(f"Formulated {len(final_objectives['primary_objectives'])} primary objectives")
+        self.logger.info("Formulated %d primary objectives", len(final_objectives["primary_objectives"]))
+        
+        # Only objectives backed by a real parsed reply are reused; fallback
+        # candidates from an outage would otherwise be served after recovery
+        if cache_key is not None and self._objective_cache is not None and any(
+            self._is_parsed_candidate(candidate) for candidate in objective_candidates
+        ):
+            self._objective_cache.set(cache_key, copy.deepcopy(final_objectives))
         
         return final_objectives
     
+    async def formulate_objectives_async(
+        self,
+        prompt: str,
+        assessment: Dict[str, Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous version of formulate_objectives.
+        
+        Args:
+            prompt: The user's input prompt
+            assessment: Results from Layer 1 assessment
+            context: Optional context from previous interactions
+            
+        Returns:
+            Structured objectives data
+        """
+        return await asyncio.to_thread(self.formulate_objectives, prompt, assessment, context)
+    
+    @staticmethod
+    def _is_parsed_candidate(candidate: Dict[str, Any]) -> bool:
+        """
+        Check whether a candidate came from a parsed JSON reply with objectives.
+        
+        Text fallbacks and empty fallback payloads, as returned by providers
+        whose API call failed, do not count.
+        """
+        return not candidate.get("fallback") and bool(candidate.get("primary_objectives"))
+    
+    def _extract_candidates(self, prompt: str) -> List[Dict[str, Any]]:
+        """
+        Extract objective candidates from every available provider.
+        
+        Args:
+            prompt: The user's input prompt
+            
+        Returns:
+            Parsed objective candidates in provider priority order
+        """
+        objective_candidates = []
+        
+        # Query providers concurrently; candidates are collected in priority order
+        max_workers = len(PROVIDER_PRIORITY) if self.config.enable_parallel_execution else 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (provider_name, executor.submit(self._extract_with_provider, provider_name, prompt))
+                for provider_name in PROVIDER_PRIORITY
+            ]
+            
+            for provider_name, future in futures:
+                try:
+                    parsed_result = future.result()
+                    if parsed_result:
+                        objective_candidates.append(parsed_result)
+                except Exception as e:
+                    self.logger.warning("Provider %s failed for objective extraction: %s", provider_name, e)
+                    continue
+        
+        return objective_candidates
+    
+    def _extract_with_provider(self, provider_name: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract objectives using a single provider.
+        
+        Args:
+            provider_name: Name of the provider
+            prompt: The user's input prompt
+            
+        Returns:
+            Parsed objectives data, or None if the provider is unavailable
+        """
+        provider = self.provider_manager.get_provider(provider_name)
+        if not provider:
+            return None
+        
+        result = provider.extract_objectives(prompt)
+        return self._parse_objectives(result, provider_name)
+    
     def _parse_objectives(self, raw_response: str, provider_name: str) -> Dict[str, Any]:
         """
         Parse objectives from provider response.
@@ -76,14 +182,10 @@ class ObjectiveFormulator:
             Parsed objectives data
         """
         try:
-            # Try to extract JSON from response
-            start_idx = raw_response.find('{')
-            end_idx = raw_response.rfind('}') + 1
+            # Try to extract JSON from response, preferring a fenced block
+            result = extract_json_object(strip_code_fence(raw_response))
             
-            if start_idx >= 0 and end_idx > start_idx:
-                json_str = raw_response[start_idx:end_idx]
-                result = json.loads(json_str)
-                
+            if result is not None:
                 return {
                     "primary_objectives": result.get("primary_objectives", []),
                     "secondary_objectives": result.get("secondary_objectives", []),
@@ -96,7 +198,7 @@ class ObjectiveFormulator:
                 return self._extract_objectives_fallback(raw_response, provider_name)
                 
         except Exception as e:
-            self.logger.warning(f"Failed to parse objectives from {provider_name}: {str(e)}")
+            self.logger.warning("Failed to parse objectives from %s: %s", provider_name, e)
             return self._extract_objectives_fallback(raw_response, provider_name)
     
     def _extract_objectives_fallback(self, text: str, provider_name: str) -> Dict[str, Any]:
@@ -116,7 +218,7 @@ class ObjectiveFormulator:
         
         for line in lines:
             line = line.strip()
-            if line and (line.startswith('-') or line.startswith('*') or line.startswith('1.')):
+            if line.startswith(BULLET_PREFIXES):
                 objective = line.lstrip('-*1234567890. ').strip()
                 if objective:
                     objectives.append(objective)
@@ -129,7 +231,8 @@ class ObjectiveFormulator:
             "secondary_objectives": objectives[3:],  # Rest as secondary
             "expected_outcomes": [],
             "constraints": [],
-            "provider": provider_name
+            "provider": provider_name,
+            "fallback": True
         }
     
     def _synthesize_objectives(self, objective_candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -189,24 +292,34 @@ class ObjectiveFormulator:
             return []
         
         unique_objectives = []
+        # Cleaned text and word set of each kept objective, computed once
+        kept_tokens: List[Tuple[str, FrozenSet[str]]] = []
         
         for obj in objectives:
             obj_clean = obj.lower().strip()
+            obj_words = frozenset(obj_clean.split())
             
             # Check if similar objective already exists
             is_duplicate = False
-            for existing in unique_objectives:
-                existing_clean = existing.lower().strip()
+            for existing_clean, existing_words in kept_tokens:
+                # Jaccard similarity cannot exceed the ratio of the set sizes,
+                # so word sets of very different size are never compared
+                size_ratio = (
+                    min(len(obj_words), len(existing_words)) /
+                    max(len(obj_words), len(existing_words), 1)
+                )
                 
                 # Simple similarity check
                 if (obj_clean in existing_clean or 
                     existing_clean in obj_clean or
-                    self._calculate_similarity(obj_clean, existing_clean) > 0.8):
+                    (size_ratio > self.SIMILARITY_THRESHOLD and
+                     self._word_set_similarity(obj_words, existing_words) > self.SIMILARITY_THRESHOLD)):
                     is_duplicate = True
                     break
             
             if not is_duplicate:
                 unique_objectives.append(obj)
+                kept_tokens.append((obj_clean, obj_words))
         
         return unique_objectives
     
@@ -221,40 +334,46 @@ class ObjectiveFormulator:
         Returns:
             Similarity score between 0 and 1
         """
-        words1 = set(str1.split())
-        words2 = set(str2.split())
+        return self._word_set_similarity(frozenset(str1.split()), frozenset(str2.split()))
+    
+    @staticmethod
+    def _word_set_similarity(words1: frozenset, words2: frozenset) -> float:
+        """
+        Calculate the Jaccard similarity of two word sets.
         
+        Args:
+            words1: Words of the first string
+            words2: Words of the second string
+            
+        Returns:
+            Similarity score between 0 and 1
+        """
         if not words1 and not words2:
             return 1.0
         if not words1 or not words2:
             return 0.0
         
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        
-        return len(intersection) / len(union)
+        return len(words1 & words2) / len(words1 | words2)
     
     def _critique_objectives(self, objectives: Dict[str, Any], original_prompt: str) -> Dict[str, Any]:
         """
         Critique and refine objectives for clarity and feasibility.
         
         Args:
-            objectives: Initial objectives
+            objectives: Initial objectives, refined in place
             original_prompt: Original user prompt
             
         Returns:
             Critiqued and refined objectives
         """
         # For now, return as-is with basic validation
-        refined_objectives = objectives.copy()
-        
         # Ensure we have at least one primary objective
-        if not refined_objectives["primary_objectives"]:
-            refined_objectives["primary_objectives"] = [
+        if not objectives["primary_objectives"]:
+            objectives["primary_objectives"] = [
                 f"Address the user's request: {original_prompt[:100]}..."
             ]
         
-        return refined_objectives
+        return objectives
     
     def _enhance_objectives(
         self,
@@ -266,30 +385,28 @@ class ObjectiveFormulator:
         Enhance objectives with success criteria and detailed outcomes.
         
         Args:
-            objectives: Base objectives
+            objectives: Base objectives, enhanced in place
             prompt: Original prompt
             context: Optional context
             
         Returns:
             Enhanced objectives with success criteria
         """
-        enhanced = objectives.copy()
-        
         # Generate success criteria
-        enhanced["success_criteria"] = []
-        for obj in enhanced["primary_objectives"]:
+        objectives["success_criteria"] = []
+        for obj in objectives["primary_objectives"]:
             criteria = f"Successfully complete: {obj}"
-            enhanced["success_criteria"].append(criteria)
+            objectives["success_criteria"].append(criteria)
         
         # Generate expected outcomes if not present
-        if not enhanced["expected_outcomes"]:
-            enhanced["expected_outcomes"] = [
+        if not objectives["expected_outcomes"]:
+            objectives["expected_outcomes"] = [
                 {
                     "outcome": f"Completion of {obj}",
                     "measurable_criteria": f"Objective '{obj}' is fully addressed",
                     "timeline": "Within execution timeframe"
                 }
-                for obj in enhanced["primary_objectives"]
+                for obj in objectives["primary_objectives"]
             ]
         
-        return enhanced
+        return objectives
@@ -3,6 +3,8 @@ Layer 3: Work Plan Generation
 Creates detailed, validated workflows for achieving objectives.
 """
 
+import hashlib
+import json
 from typing import Dict, Any
 from ..utils.logger import get_logger
 
@@ -31,7 +33,7 @@ class WorkPlanGenerator:
         
         # Basic work plan structure
         work_plan = {
-            "workflow_id": f"workflow_{hash(str(objectives)) % 10000}",
+            "workflow_id": self._workflow_id(objectives),
             "steps": [],
             "critical_path": [],
             "parallel_groups": {}
@@ -54,5 +56,22 @@ class WorkPlanGenerator:
             work_plan["critical_path"].append(f"step_{step_id}")
             step_id += 1
         
-        self.logger.info(f"Generated work plan with {len(work_plan['steps'])} steps")
+        self.logger.info("Generated work plan with %d steps", len(work_plan["steps"]))
         return work_plan
+    
+    @staticmethod
+    def _workflow_id(objectives: Dict[str, Any]) -> str:
+        """
+        Derive a stable workflow identifier from objectives.
+        
+        Args:
+            objectives: Structured objectives data
+            
+        Returns:
+            Identifier that is the same for identical objectives across runs
+        """
+        digest = hashlib.blake2b(
+            json.dumps(objectives, sort_keys=True, default=str).encode("utf-8"),
+            digest_size=8
+        )
+        return f"workflow_{digest.hexdigest()}"
@@ -7,6 +7,10 @@ from typing import Dict, Any
 from ..utils.logger import get_logger
 
 
+# Shared by every executor agent so their requests start with the same prefix
+AGENT_SYSTEM_PROMPT = "You are a helpful AI agent executing tasks."
+
+
 class AgentOrchestrator:
     """
     Orchestrates agents from work plans.
@@ -37,6 +41,7 @@ class AgentOrchestrator:
         self.logger.info("Orchestrating agents from work plan")
         
         agents = []
+        agent_ids = []
         execution_phases = []
         
         # Create agents from work plan steps
@@ -45,29 +50,30 @@ class AgentOrchestrator:
                 "agent_id": f"agent_{step['step_id']}",
                 "agent_name": f"Agent for {step['description']}",
                 "agent_type": "executor",
-                "system_prompt": "You are a helpful AI agent executing tasks.",
+                "system_prompt": AGENT_SYSTEM_PROMPT,
                 "input_prompt": step["description"],
                 "model": "gpt-4",
                 "tools": step["required_tools"] if enable_internet else [],
-                "dependencies": step["dependencies"],
+                "dependencies": [f"agent_{dep}" for dep in step["dependencies"]],
                 "parallel_group": step["parallel_group"],
                 "timeout": "1800",
                 "retry_policy": "retry_3",
                 "output_format": "text"
             }
             agents.append(agent)
+            agent_ids.append(agent["agent_id"])
         
         # Create execution phases
         execution_phases.append({
             "phase_id": "phase_1",
-            "agents": [agent["agent_id"] for agent in agents],
+            "agents": agent_ids,
             "execution_type": "sequential",
             "dependencies": []
         })
         
         orchestration = {
             "agents": agents,
-            "execution_order": [agent["agent_id"] for agent in agents],
+            "execution_order": list(agent_ids),
             "orchestration_plan": {
                 "execution_phases": execution_phases,
                 "resource_allocation": {
@@ -77,5 +83,5 @@ class AgentOrchestrator:
             }
         }
         
-        self.logger.info(f"Orchestrated {len(agents)} agents")
+        self.logger.info("Orchestrated %d agents", len(agents))
         return orchestration
@@ -3,9 +3,52 @@ Layer 5: Execution Engine
 Executes agents according to orchestration plan with monitoring.
 """
 
+import asyncio
+import sys
 import time
-from typing import Dict, Any
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
 from ..utils.logger import get_logger
+from ..utils.scheduling import dependency_batches
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get a plain dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class AgentResult:
+    """
+    Outcome of a single agent execution.
+    """
+    status: str
+    output: str = ""
+    duration: float = 0.0
+    tools_used: List[str] = field(default_factory=list)
+    model: str = "unknown"
+    error: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the JSON-serializable form returned to callers.
+        
+        Returns:
+            Status, output, tools and model for completed agents, or status
+            and error for failed ones, plus the duration in both cases
+        """
+        if self.status == "completed":
+            return {
+                "status": self.status,
+                "output": self.output,
+                "duration": self.duration,
+                "tools_used": self.tools_used,
+                "model": self.model
+            }
+        return {
+            "status": self.status,
+            "error": self.error,
+            "duration": self.duration
+        }
 
 
 class ExecutionEngine:
@@ -26,6 +69,8 @@ class ExecutionEngine:
         """
         Execute the orchestration plan.
         
+        Synchronous wrapper around execute_orchestration_plan_async.
+        
         Args:
             orchestration: Agent orchestration plan
             max_execution_time: Maximum execution time in seconds
@@ -33,9 +78,34 @@ class ExecutionEngine:
         Returns:
             Execution results
         """
+        return asyncio.run(
+            self.execute_orchestration_plan_async(orchestration, max_execution_time)
+        )
+    
+    async def execute_orchestration_plan_async(
+        self,
+        orchestration: Dict[str, Any],
+        max_execution_time: int = 3600
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous version of execute_orchestration_plan.
+        
+        Agents are grouped into dependency phases that run in order. Agents
+        within a phase are independent of each other and are gathered
+        concurrently, at most max_concurrent_agents at a time (one at a time
+        when parallel execution is disabled).
+        
+        Args:
+            orchestration: Agent orchestration plan
+            max_execution_time: Maximum execution time in seconds
+            
+        Returns:
+            Execution results, with an AgentResult per agent id
+        """
         self.logger.info("Starting agent execution")
         
         start_time = time.time()
+        start_clock = time.monotonic()
         execution_results = {
             "execution_id": f"exec_{int(start_time)}",
             "start_time": start_time,
@@ -44,45 +114,33 @@ class ExecutionEngine:
             "status": "running"
         }
         
-        # Execute agents
-        for agent in orchestration["agents"]:
-            agent_start = time.time()
+        concurrency = self.config.max_concurrent_agents if self.config.enable_parallel_execution else 1
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Resolved once for the whole run; without one every agent fails
+        try:
+            provider = self.provider_manager.get_primary_provider()
+        except RuntimeError as e:
+            self.logger.error("No provider available for agent execution: %s", e)
+            provider = None
+        
+        # Execute agents phase by phase, tallying metrics as results arrive
+        agent_results = execution_results["agent_results"]
+        successful_agents = 0
+        agent_duration_sum = 0.0
+        for batch in dependency_batches(orchestration["agents"], "agent_id", self.logger):
+            batch_results = await asyncio.gather(
+                *(self._execute_agent_async(agent, provider, semaphore) for agent in batch)
+            )
             
-            try:
-                self.logger.info(f"Executing agent: {agent['agent_id']}")
-                
-                # Get provider for agent execution
-                provider = self.provider_manager.get_primary_provider()
-                
-                # Execute agent task
-                result = provider.generate_response(
-                    agent["input_prompt"],
-                    max_tokens=1000
-                )
-                
-                agent_duration = time.time() - agent_start
-                
-                execution_results["agent_results"][agent["agent_id"]] = {
-                    "status": "completed",
-                    "output": result,
-                    "duration": agent_duration,
-                    "tools_used": agent.get("tools", []),
-                    "model": agent.get("model", "unknown")
-                }
-                
-                self.logger.info(f"Agent {agent['agent_id']} completed in {agent_duration:.2f}s")
-                
-            except Exception as e:
-                self.logger.error(f"Agent {agent['agent_id']} failed: {str(e)}")
-                execution_results["agent_results"][agent["agent_id"]] = {
-                    "status": "failed",
-                    "error": str(e),
-                    "duration": time.time() - agent_start
-                }
+            for agent, result in zip(batch, batch_results):
+                agent_results[agent["agent_id"]] = result
+                if result.status == "completed":
+                    successful_agents += 1
+                agent_duration_sum += result.duration
         
         # Calculate final metrics
-        total_duration = time.time() - start_time
-        successful_agents = sum(1 for r in execution_results["agent_results"].values() if r["status"] == "completed")
+        total_duration = time.monotonic() - start_clock
         total_agents = len(orchestration["agents"])
         
         execution_results.update({
@@ -92,11 +150,82 @@ class ExecutionEngine:
                 "total_agents": total_agents,
                 "successful_agents": successful_agents,
                 "success_rate": successful_agents / total_agents if total_agents > 0 else 0,
-                "average_agent_duration": sum(r.get("duration", 0) for r in execution_results["agent_results"].values()) / total_agents if total_agents > 0 else 0
+                "average_agent_duration": agent_duration_sum / total_agents if total_agents > 0 else 0
             },
             "status": "completed"
         })
         
-        self.logger.info(f"Execution completed in {total_duration:.2f}s with {successful_agents}/{total_agents} successful agents")
+        self.logger.info(
+            "Execution completed in %.2fs with %d/%d successful agents",
+            total_duration, successful_agents, total_agents
+        )
         
         return execution_results
+    
+    async def _execute_agent_async(
+        self,
+        agent: Dict[str, Any],
+        provider: Optional[Any],
+        semaphore: asyncio.Semaphore
+    ) -> AgentResult:
+        """
+        Execute a single agent once a concurrency slot is free.
+        
+        Args:
+            agent: Agent specification
+            provider: Provider executing the agent, or None if unavailable
+            semaphore: Semaphore bounding concurrent agents
+            
+        Returns:
+            Agent result with status, output and duration
+        """
+        async with semaphore:
+            return await asyncio.to_thread(self._execute_agent, agent, provider)
+    
+    def _execute_agent(self, agent: Dict[str, Any], provider: Optional[Any]) -> AgentResult:
+        """
+        Execute a single agent and capture its result.
+        
+        Args:
+            agent: Agent specification
+            provider: Provider executing the agent, or None if unavailable
+            
+        Returns:
+            Agent result with status, output and duration
+        """
+        agent_id = agent["agent_id"]
+        agent_start = time.monotonic()
+        
+        try:
+            self.logger.info("Executing agent: %s", agent_id)
+            
+            if provider is None:
+                raise RuntimeError("No providers available")
+            
+            # Execute agent task
+            result = provider.generate_response(
+                agent["input_prompt"],
+                system_instruction=agent["system_prompt"],
+                max_tokens=1000
+            )
+            
+            agent_duration = time.monotonic() - agent_start
+            
+            self.logger.info("Agent %s completed in %.2fs", agent_id, agent_duration)
+            
+            return AgentResult(
+                status="completed",
+                output=result,
+                duration=agent_duration,
+                tools_used=agent.get("tools", []),
+                model=agent.get("model", "unknown")
+            )
+            
+        except Exception as e:
+            agent_duration = time.monotonic() - agent_start
+            self.logger.error("Agent %s failed: %s", agent_id, e)
+            return AgentResult(
+                status="failed",
+                error=str(e),
+                duration=agent_duration
+            )
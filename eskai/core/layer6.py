@@ -3,10 +3,49 @@ Layer 6: Final Result Rendering
 Synthesizes execution results into coherent final output.
 """
 
-from typing import Dict, Any, List
+import asyncio
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from ..utils.logger import get_logger
 
 
+# Static synthesis instructions, sent ahead of the per-run objectives/outputs
+SYNTHESIS_SYSTEM_PROMPT = (
+    "Synthesize the agent outputs provided by the user into a comprehensive final result. "
+    "Provide a coherent, comprehensive response that addresses all the original objectives."
+)
+
+
+@lru_cache(maxsize=1024)
+def _score_alignment(result: str, objectives: Tuple[str, ...]) -> Tuple[float, ...]:
+    """
+    Score how well a result covers each objective.
+    
+    Pure and cached, so re-rendering the same result against the same
+    objectives skips the keyword scan.
+    
+    Args:
+        result: Synthesized result text
+        objectives: Primary objectives
+        
+    Returns:
+        Fraction of each objective's words found in the result
+    """
+    result_lower = result.lower()
+    # Whole-word hits are a set lookup; only the other words need a
+    # substring scan of the result
+    result_words = set(result_lower.split())
+    scores = []
+    
+    for obj in objectives:
+        # Simple heuristic: check if key words from objective appear in result
+        obj_words = obj.lower().split()
+        found_words = sum(1 for word in obj_words if word in result_words or word in result_lower)
+        scores.append(found_words / len(obj_words) if obj_words else 0)
+    
+    return tuple(scores)
+
+
 class ResultRenderer:
     """
     Renders final results from execution data.
@@ -20,7 +59,8 @@ class ResultRenderer:
     def render_final_result(
         self,
         execution_results: Dict[str, Any],
-        original_objectives: Dict[str, Any]
+        original_objectives: Dict[str, Any],
+        on_chunk: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """
         Render final result from execution data.
@@ -28,6 +68,8 @@ class ResultRenderer:
         Args:
             execution_results: Results from Layer 5 execution
             original_objectives: Original objectives from Layer 2
+            on_chunk: Optional callback receiving the synthesis text as it is
+                streamed, for providers that support streaming
             
         Returns:
             Final rendered result
@@ -37,11 +79,11 @@ class ResultRenderer:
         # Collect all agent outputs
         agent_outputs = []
         for agent_id, result in execution_results["agent_results"].items():
-            if result["status"] == "completed":
+            if result.status == "completed":
                 agent_outputs.append({
                     "agent_id": agent_id,
-                    "output": result["output"],
-                    "tools_used": result.get("tools_used", [])
+                    "output": result.output,
+                    "tools_used": result.tools_used
                 })
         
         # Synthesize results
@@ -49,23 +91,31 @@ class ResultRenderer:
             provider = self.provider_manager.get_primary_provider()
             
             synthesis_prompt = f"""
-            Synthesize the following agent outputs into a comprehensive final result:
-            
             Original Objectives: {original_objectives["primary_objectives"]}
             
             Agent Outputs:
             {self._format_agent_outputs(agent_outputs)}
-            
-            Provide a coherent, comprehensive response that addresses all the original objectives.
             """
             
-            synthesized_result = provider.generate_response(
-                synthesis_prompt,
-                max_tokens=2000
-            )
+            if on_chunk is not None and hasattr(provider, "stream_response"):
+                chunks = []
+                for chunk in provider.stream_response(
+                    synthesis_prompt,
+                    system_instruction=SYNTHESIS_SYSTEM_PROMPT,
+                    max_tokens=2000
+                ):
+                    chunks.append(chunk)
+                    on_chunk(chunk)
+                synthesized_result = "".join(chunks).strip()
+            else:
+                synthesized_result = provider.generate_response(
+                    synthesis_prompt,
+                    system_instruction=SYNTHESIS_SYSTEM_PROMPT,
+                    max_tokens=2000
+                )
             
         except Exception as e:
-            self.logger.warning(f"Synthesis failed, using fallback: {str(e)}")
+            self.logger.warning("Synthesis failed, using fallback: %s", e)
             synthesized_result = self._fallback_synthesis(agent_outputs, original_objectives)
         
         # Validate against objectives
@@ -87,16 +137,39 @@ class ResultRenderer:
             }
         }
         
-        self.logger.info(f"Final result rendered with completeness score: {final_result['completeness_score']:.2f}")
+        self.logger.info("Final result rendered with completeness score: %.2f", final_result["completeness_score"])
         
         return final_result
     
+    async def render_final_result_async(
+        self,
+        execution_results: Dict[str, Any],
+        original_objectives: Dict[str, Any],
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous version of render_final_result.
+        
+        Args:
+            execution_results: Results from Layer 5 execution
+            original_objectives: Original objectives from Layer 2
+            on_chunk: Optional streaming callback, invoked from a worker thread
+            
+        Returns:
+            Final rendered result
+        """
+        return await asyncio.to_thread(
+            self.render_final_result,
+            execution_results,
+            original_objectives,
+            on_chunk
+        )
+    
     def _format_agent_outputs(self, agent_outputs: List[Dict[str, Any]]) -> str:
         """Format agent outputs for synthesis."""
-        formatted = []
-        for i, output in enumerate(agent_outputs, 1):
-            formatted.append(f"Agent {i} Output: {output['output']}")
-        return "\n\n".join(formatted)
+        return "\n\n".join(
+            f"Agent {i} Output: {output['output']}" for i, output in enumerate(agent_outputs, 1)
+        )
     
     def _fallback_synthesis(
         self,
@@ -107,14 +180,14 @@ class ResultRenderer:
         if not agent_outputs:
             return "No results were generated due to execution failures."
         
-        summary = f"Summary based on {len(agent_outputs)} agent executions:\n\n"
+        # Collected as parts and joined once instead of repeated concatenation
+        parts = [f"Summary based on {len(agent_outputs)} agent executions:\n\n"]
+        parts.extend(f"Result {i}: {output['output']}\n\n" for i, output in enumerate(agent_outputs, 1))
         
-        for i, output in enumerate(agent_outputs, 1):
-            summary += f"Result {i}: {output['output']}\n\n"
+        if original_objectives["primary_objectives"]:
+            parts.append(f"\nObjectives addressed: {', '.join(original_objectives['primary_objectives'])}")
         
-        summary += f"\nObjectives addressed: {', '.join(original_objectives['primary_objectives'])}"
-        
-        return summary
+        return "".join(parts)
     
     def _validate_against_objectives(
         self,
@@ -124,16 +197,15 @@ class ResultRenderer:
         """Validate result against original objectives."""
         
         # Simple keyword-based validation
-        result_lower = result.lower()
-        objectives_met = []
+        primary_objectives = tuple(objectives["primary_objectives"])
+        try:
+            scores = _score_alignment(result, primary_objectives)
+        except TypeError:
+            # Unhashable objective entries cannot be cached
+            scores = _score_alignment.__wrapped__(result, primary_objectives)
         
-        for obj in objectives["primary_objectives"]:
-            # Simple heuristic: check if key words from objective appear in result
-            obj_words = obj.lower().split()
-            found_words = sum(1 for word in obj_words if word in result_lower)
-            
-            alignment_score = found_words / len(obj_words) if obj_words else 0
-            
+        objectives_met = []
+        for obj, alignment_score in zip(primary_objectives, scores):
             objectives_met.append({
                 "objective": obj,
                 "alignment_score": alignment_score,
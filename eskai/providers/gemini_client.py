@@ -2,10 +2,66 @@
 Gemini API client implementation
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional, Tuple
 from ..utils.logger import get_logger
+from ..utils.llm_cache import LLMCache
+from ..utils.http import get_http_client
+from ..utils.retry import acall_with_retry, call_with_retry
+from ..utils.serialization import dumps, dumps_joined
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+
+
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+
+INTENT_SYSTEM_PROMPT = (
+    "You are an expert intent classification system. "
+    "Analyze the user's message and determine their intent as accurately as possible. "
+    "Respond ONLY in valid JSON format with the following keys: "
+    "'intent' (a concise label for the user's intent), "
+    "'confidence' (a float between 0 and 1 representing your confidence in the classification), "
+    "and 'reasoning' (a brief explanation for your classification). "
+    "Do not include any extra text or formatting outside the JSON object."
+)
+
+OBJECTIVES_SYSTEM_PROMPT = (
+    "You are an expert at extracting objectives from user input. "
+    "Analyze the user's message and identify their primary and secondary objectives. "
+    "Respond ONLY in valid JSON format with the following keys: "
+    "'primary_objectives' (a list of the main objectives), "
+    "'secondary_objectives' (a list of any secondary objectives). "
+    "Do not include any extra text or formatting outside the JSON object."
+)
+
+WORKFLOW_SYSTEM_PROMPT = (
+    "You are an expert workflow designer. "
+    "Create a detailed workflow based on the provided objectives. "
+    "Respond ONLY in valid JSON format with the following structure: "
+    "'workflow_id' (a unique identifier), "
+    "'steps' (a list of workflow steps with id, description, type, dependencies, etc.), "
+    "'critical_path' (list of critical step IDs), "
+    "'parallel_groups' (groups of steps that can run in parallel). "
+    "Do not include any extra text or formatting outside the JSON object."
+)
+
+SYNTHESIS_SYSTEM_PROMPT = (
+    "You are an expert at synthesizing multiple pieces of information into coherent results. "
+    "Take the provided agent outputs and original objectives, then create a comprehensive "
+    "final result that addresses all objectives clearly and professionally. "
+    "Focus on clarity, completeness, and actionable insights."
+)
+
+# Returned by the helper methods when the API call fails
+WORKFLOW_FALLBACK = '{"workflow_id": "gemini_workflow", "steps": []}'
+SYNTHESIS_FALLBACK = "Gemini synthesis result"
+
+SYNTHESIS_USER_TEMPLATE = (
+    "Synthesize these agent outputs into a coherent final result:\n\n"
+    "Original Objectives: {original_objectives}\n"
+    "Agent Outputs:\n{agent_outputs}\n\n"
+    "Provide a comprehensive synthesis that addresses all objectives."
+)
 
 
 class GeminiClient:
@@ -13,123 +69,295 @@ class GeminiClient:
     Gemini API client for ESKAI framework.
     """
     
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash", temperature: float = 0.7):
+    # Bound on distinct (system_instruction, temperature) configs kept for reuse
+    CONTENT_CONFIG_CACHE_SIZE = 32
+    
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-flash",
+        temperature: float = 0.7,
+        cache: Optional[LLMCache] = None,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0
+    ):
         self.api_key = api_key
         self.model = model
         self.temperature = temperature
-        self.client = genai.Client(api_key=self.api_key)
+        self.cache = cache
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self._content_configs: Dict[Tuple[str, Optional[float]], types.GenerateContentConfig] = {}
+        self.client = genai.Client(api_key=self.api_key, http_options=self._http_options())
         self.logger = get_logger("GeminiClient")
     
+    @staticmethod
+    def _http_options() -> Optional[types.HttpOptions]:
+        """
+        Route requests through the shared connection pool when supported.
+        
+        google-genai accepts a custom httpx client from 1.46 onwards; older
+        releases keep their own per-client connections.
+        """
+        if "httpx_client" not in getattr(types.HttpOptions, "model_fields", {}):
+            return None
+        return types.HttpOptions(httpx_client=get_http_client())
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Retry rate limits, server errors and dropped connections."""
+        if isinstance(error, errors.APIError):
+            return error.code == 429 or isinstance(error, errors.ServerError)
+        return isinstance(error, httpx.TransportError)
+    
     def generate_response(
         self,
         prompt: str,
-        system_instruction: str = "You are a helpful assistant.",
-        **kwargs
+        system_instruction: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: Optional[float] = None,
+        **kwargs: Any
     ) -> str:
         """
         Generate response using Gemini API.
         """
-        response = self.client.models.generate_content(
-            model=self.model,
-            config=types.GenerateContentConfig(
-                system_instruction=system_instruction
+        temperature = self.temperature if temperature is None else temperature
+        
+        cache_key = self._cache_key(prompt, system_instruction, temperature)
+        if cache_key is not None and self.cache is not None:
+            response: str = self.cache.get_or_compute(
+                cache_key,
+                lambda: self._generate_content(prompt, system_instruction, temperature)
+            )
+            return response
+        
+        return self._generate_content(prompt, system_instruction, temperature)
+    
+    async def agenerate_response(
+        self,
+        prompt: str,
+        system_instruction: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: Optional[float] = None,
+        **kwargs: Any
+    ) -> str:
+        """
+        Asynchronous version of generate_response, using the SDK's aio client.
+        """
+        temperature = self.temperature if temperature is None else temperature
+        
+        cache_key = self._cache_key(prompt, system_instruction, temperature)
+        if cache_key is not None and self.cache is not None:
+            response: str = await self.cache.aget_or_compute(
+                cache_key,
+                lambda: self._agenerate_content(prompt, system_instruction, temperature)
+            )
+            return response
+        
+        return await self._agenerate_content(prompt, system_instruction, temperature)
+    
+    def _generate_content(self, prompt: str, system_instruction: str, temperature: float) -> str:
+        """Send a generate_content request, retrying transient errors, and return the stripped text."""
+        response = call_with_retry(
+            lambda: self.client.models.generate_content(
+                model=self.model,
+                config=self._content_config(system_instruction, temperature),
+                contents=prompt
             ),
-            contents=prompt
+            should_retry=self._is_retryable,
+            retry_attempts=self.retry_attempts,
+            retry_delay=self.retry_delay,
+            logger=self.logger
         )
         return response.text.strip() if response.text is not None else ""
     
+    async def _agenerate_content(self, prompt: str, system_instruction: str, temperature: float) -> str:
+        """Asynchronous version of _generate_content."""
+        response = await acall_with_retry(
+            lambda: self.client.aio.models.generate_content(
+                model=self.model,
+                config=self._content_config(system_instruction, temperature),
+                contents=prompt
+            ),
+            should_retry=self._is_retryable,
+            retry_attempts=self.retry_attempts,
+            retry_delay=self.retry_delay,
+            logger=self.logger
+        )
+        return response.text.strip() if response.text is not None else ""
+    
+    def stream_response(
+        self,
+        prompt: str,
+        system_instruction: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: Optional[float] = None,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Stream a response from the Gemini API as it is generated.
+        
+        Cached responses are yielded as a single chunk.
+        """
+        temperature = self.temperature if temperature is None else temperature
+        
+        cache_key = self._cache_key(prompt, system_instruction, temperature)
+        if cache_key is not None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        stream = self.client.models.generate_content_stream(
+            model=self.model,
+            config=self._content_config(system_instruction, temperature),
+            contents=prompt
+        )
+        
+        chunks = []
+        for chunk in stream:
+            if chunk.text:
+                chunks.append(chunk.text)
+                yield chunk.text
+        
+        if cache_key is not None and self.cache is not None:
+            self.cache.set(cache_key, "".join(chunks).strip())
+    
+    def check_health(self, timeout: float = 2.0) -> None:
+        """
+        Check that the API is reachable and the model is served, without spending tokens.
+        
+        Args:
+            timeout: Request timeout in seconds
+        
+        Raises:
+            Exception: If the model metadata cannot be retrieved
+        """
+        self.client.models.get(
+            model=self.model,
+            config=types.GetModelConfig(http_options=types.HttpOptions(timeout=int(timeout * 1000)))
+        )
+    
+    def _content_config(
+        self,
+        system_instruction: str,
+        temperature: Optional[float]
+    ) -> types.GenerateContentConfig:
+        """Return a reusable generation config, building it on first use."""
+        key = (system_instruction, temperature)
+        config = self._content_configs.get(key)
+        if config is None:
+            config = types.GenerateContentConfig(
+                system_instruction=system_instruction,
+                temperature=temperature
+            )
+            if len(self._content_configs) < self.CONTENT_CONFIG_CACHE_SIZE:
+                self._content_configs[key] = config
+        return config
+    
+    def _cache_key(self, prompt: str, system_instruction: str, temperature: float) -> Optional[str]:
+        """Build the response cache key, or None if the request is not cacheable."""
+        if self.cache is None or not self.cache.is_cacheable(temperature):
+            return None
+        return self.cache.make_key(self.model, prompt, system_instruction, temperature=temperature)
+    
     def classify_intent(self, prompt: str) -> str:
         """Classify intent using Gemini. Return JSON string with intent, confidence, and reasoning."""
         response = self.generate_response(
             prompt=prompt,
-            system_instruction=(
-            "You are an expert intent classification system. "
-            "Analyze the user's message and determine their intent as accurately as possible. "
-            "Respond ONLY in valid JSON format with the following keys: "
-            "'intent' (a concise label for the user's intent), "
-            "'confidence' (a float between 0 and 1 representing your confidence in the classification), "
-            "and 'reasoning' (a brief explanation for your classification). "
-            "Do not include any extra text or formatting outside the JSON object."
-            )
+            system_instruction=INTENT_SYSTEM_PROMPT,
+            temperature=0.0  # Deterministic, so repeated requests are served from the cache
         )
         return response
+    
+    async def aclassify_intent(self, prompt: str) -> str:
+        """Asynchronous version of classify_intent."""
+        return await self.agenerate_response(
+            prompt=prompt,
+            system_instruction=INTENT_SYSTEM_PROMPT,
+            temperature=0.0
+        )
 
     def extract_objectives(self, prompt: str) -> str:
         """Extract objectives using Gemini."""
-        """
-        Generate response using Gemini API.
-        """
         try:
-            response = self.client.models.generate_content(
-                model=self.model,
-                config=types.GenerateContentConfig(
-                    system_instruction=(
-                        "You are an expert at extracting objectives from user input. "
-                        "Analyze the user's message and identify their primary and secondary objectives. "
-                        "Respond ONLY in valid JSON format with the following keys: "
-                        "'primary_objectives' (a list of the main objectives), "
-                        "'secondary_objectives' (a list of any secondary objectives). "
-                        "Do not include any extra text or formatting outside the JSON object."
-                    )
-                ),
-                contents=prompt
+            return self.generate_response(
+                prompt=prompt,
+                system_instruction=OBJECTIVES_SYSTEM_PROMPT,
+                temperature=0.0  # Deterministic, so repeated requests are served from the cache
             )
-            return response.text.strip() if response.text else ""
         except Exception as e:
             self.logger.error(f"Error generating response: {e}")
             return ""
         # return '{"primary_objectives": ["gemini_objective"], "secondary_objectives": []}'
+    
+    async def aextract_objectives(self, prompt: str) -> str:
+        """Asynchronous version of extract_objectives."""
+        try:
+            return await self.agenerate_response(
+                prompt=prompt,
+                system_instruction=OBJECTIVES_SYSTEM_PROMPT,
+                temperature=0.0
+            )
+        except Exception as e:
+            self.logger.error(f"Error generating response: {e}")
+            return ""
 
     def generate_workflow(self, objectives_data: Dict[str, Any]) -> str:
         """Generate workflow using Gemini."""
         try:
             prompt = f"Based on these objectives: {objectives_data}, create a detailed workflow."
-            response = self.client.models.generate_content(
-                model=self.model,
-                config=types.GenerateContentConfig(
-                    system_instruction=(
-                        "You are an expert workflow designer. "
-                        "Create a detailed workflow based on the provided objectives. "
-                        "Respond ONLY in valid JSON format with the following structure: "
-                        "'workflow_id' (a unique identifier), "
-                        "'steps' (a list of workflow steps with id, description, type, dependencies, etc.), "
-                        "'critical_path' (list of critical step IDs), "
-                        "'parallel_groups' (groups of steps that can run in parallel). "
-                        "Do not include any extra text or formatting outside the JSON object."
-                    )
-                ),
-                contents=prompt
+            response = self.generate_response(
+                prompt=prompt,
+                system_instruction=WORKFLOW_SYSTEM_PROMPT,
+                temperature=0.0  # Deterministic, so repeated requests are served from the cache
             )
-            return response.text.strip() if response.text else '{"workflow_id": "gemini_workflow", "steps": []}'
+            return response or WORKFLOW_FALLBACK
         except Exception as e:
             self.logger.error(f"Error generating workflow: {e}")
-            return '{"workflow_id": "gemini_workflow", "steps": []}'
+            return WORKFLOW_FALLBACK
+    
+    async def agenerate_workflow(self, objectives_data: Dict[str, Any]) -> str:
+        """Asynchronous version of generate_workflow."""
+        try:
+            prompt = f"Based on these objectives: {objectives_data}, create a detailed workflow."
+            response = await self.agenerate_response(
+                prompt=prompt,
+                system_instruction=WORKFLOW_SYSTEM_PROMPT,
+                temperature=0.0
+            )
+            return response or WORKFLOW_FALLBACK
+        except Exception as e:
+            self.logger.error(f"Error generating workflow: {e}")
+            return WORKFLOW_FALLBACK
     
     def synthesize_results(self, agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
         """Synthesize results using Gemini."""
         try:
-            prompt = f"""
-            Synthesize these agent outputs into a coherent final result:
-            
-            Original Objectives: {original_objectives}
-            Agent Outputs: {agent_outputs}
-            
-            Provide a comprehensive synthesis that addresses all objectives.
-            """
-            
             response = self.client.models.generate_content(
                 model=self.model,
-                config=types.GenerateContentConfig(
-                    system_instruction=(
-                        "You are an expert at synthesizing multiple pieces of information into coherent results. "
-                        "Take the provided agent outputs and original objectives, then create a comprehensive "
-                        "final result that addresses all objectives clearly and professionally. "
-                        "Focus on clarity, completeness, and actionable insights."
-                    )
-                ),
-                contents=prompt
+                config=self._content_config(SYNTHESIS_SYSTEM_PROMPT, None),
+                contents=self._synthesis_prompt(agent_outputs, original_objectives)
+            )
+            return response.text.strip() if response.text else SYNTHESIS_FALLBACK
+        except Exception as e:
+            self.logger.error(f"Error synthesizing results: {e}")
+            return SYNTHESIS_FALLBACK
+    
+    async def asynthesize_results(self, agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
+        """Asynchronous version of synthesize_results."""
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                config=self._content_config(SYNTHESIS_SYSTEM_PROMPT, None),
+                contents=self._synthesis_prompt(agent_outputs, original_objectives)
             )
-            return response.text.strip() if response.text else "Gemini synthesis result"
+            return response.text.strip() if response.text else SYNTHESIS_FALLBACK
         except Exception as e:
             self.logger.error(f"Error synthesizing results: {e}")
-            return "Gemini synthesis result"
+            return SYNTHESIS_FALLBACK
+    
+    @staticmethod
+    def _synthesis_prompt(agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
+        """Build the user prompt for synthesize_results, one JSON document per output."""
+        return SYNTHESIS_USER_TEMPLATE.format(
+            original_objectives=dumps(original_objectives),
+            agent_outputs=dumps_joined(agent_outputs)
+        )
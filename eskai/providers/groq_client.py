@@ -2,184 +2,419 @@
 Groq API client implementation
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 from ..utils.logger import get_logger
-from groq import Groq
+from ..utils.llm_cache import LLMCache
+from ..utils.http import get_http_client
+from ..utils.retry import acall_with_retry, call_with_retry
+from ..utils.serialization import dumps, dumps_joined
+from groq import AsyncGroq, Groq, APIConnectionError, InternalServerError, RateLimitError
 from dotenv import load_dotenv
+import asyncio
 import os
 
 load_dotenv()  # Load environment variables from .env file
 
+# Rate limits, dropped connections and 5xx responses are worth retrying
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+INTENT_SYSTEM_PROMPT = """
+    You are an intent classifier. Analyze the user's prompt and classify it as either 'chat'
+    (simple conversation) or 'objective' (task requiring multi-step execution).
+    Return your response in this exact JSON format:
+    {
+        "intent": "chat" or "objective",
+        "confidence": float between 0.0 and 1.0,
+        "reasoning": "brief explanation of classification"
+    }
+"""
+
+OBJECTIVES_SYSTEM_PROMPT = """
+    You are an objective extraction specialist. Analyze the user's prompt and extract clear,
+    actionable objectives.
+    Return your response in this exact JSON format:
+    {
+        "primary_objectives": ["main goal 1", "main goal 2"],
+        "secondary_objectives": ["supporting goal 1", "supporting goal 2"],
+        "constraints": ["constraint 1", "constraint 2"],
+        "success_criteria": ["criterion 1", "criterion 2"]
+    }
+"""
+
+WORKFLOW_SYSTEM_PROMPT = """
+    You are a workflow generation expert. Based on the provided objectives, create a detailed
+    step-by-step workflow plan.
+    Return your response in this exact JSON format:
+    {
+        "workflow_id": "unique_workflow_identifier",
+        "steps": [
+            {
+                "step_id": 1,
+                "action": "description of action",
+                "agent_type": "agent type needed",
+                "expected_output": "what this step should produce",
+                "dependencies": []
+            }
+        ],
+        "estimated_duration": "time estimate",
+        "complexity_level": "low/medium/high"
+    }
+"""
+
+SYNTHESIS_SYSTEM_PROMPT = """
+    You are a result synthesis expert. Analyze the agent outputs and original objectives to create a
+    comprehensive final result.
+
+    Your response should be a well-structured summary that:
+    1. Evaluates how well the objectives were met
+    2. Synthesizes key findings from all agent outputs
+    3. Identifies any gaps or areas for improvement
+    4. Provides actionable next steps if needed
+
+    Return a clear, professional summary."""
+
+# Returned by the helper methods when the API call fails
+INTENT_FALLBACK = '{"intent": "objective", "confidence": 0.8, "reasoning": "Groq classification fallback"}'
+OBJECTIVES_FALLBACK = '{"primary_objectives": [], "secondary_objectives": [], "constraints": [], "success_criteria": []}'
+WORKFLOW_FALLBACK = '{"workflow_id": "groq_workflow_fallback", "steps": [], "estimated_duration": "unknown", "complexity_level": "medium"}'
+SYNTHESIS_FALLBACK = "Groq synthesis result - fallback due to API error"
+
+SYNTHESIS_USER_TEMPLATE = """
+Original Objectives: {original_objectives}
+
+Agent Outputs:
+{agent_outputs}
+
+Please synthesize these results into a comprehensive final report.
+"""
+
+
 class GroqClient:
     """
     Groq API client for ESKAI framework.
     """
     
-    def __init__(self, api_key: str, model: str = "qwen/qwen3-32b", temperature: float = 0.7):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "qwen/qwen3-32b",
+        temperature: float = 0.7,
+        cache: Optional[LLMCache] = None,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0
+    ):
         self.api_key = os.getenv("GROQ_API_KEY")
         self.model = model
         self.temperature = temperature
-        self.client = Groq(api_key=self.api_key)
+        self.cache = cache
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        # Retries are handled by _create_completion
+        self.client = Groq(api_key=self.api_key, http_client=get_http_client(), max_retries=0)
         self.logger = get_logger("GroqClient")
+        
+        # Async connections are bound to an event loop, see _get_async_client
+        self._async_client: Optional[AsyncGroq] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def generate_response(
         self,
         prompt: str,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
-        **kwargs
+        system_instruction: Optional[str] = None,
+        **kwargs: Any
     ) -> str:
         """
         Generate response using Groq API.
+        
+        Static instructions passed as system_instruction are sent as a
+        leading system message so the request prefix stays cacheable.
+        Errors left after retrying are raised so callers can fail over.
         """
+        temperature = self.temperature if temperature is None else temperature
+        max_tokens = max_tokens or 4096
+        
+        try:
+            return self._complete(prompt, system_instruction, temperature, max_tokens)
+        except Exception as e:
+            self.logger.error(f"Groq API error: {e}")
+            raise
+    
+    async def agenerate_response(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_instruction: Optional[str] = None,
+        **kwargs: Any
+    ) -> str:
+        """Asynchronous version of generate_response, using the AsyncGroq SDK."""
+        temperature = self.temperature if temperature is None else temperature
+        max_tokens = max_tokens or 4096
+        
         try:
-            completion = self.client.chat.completions.create(
+            return await self._acomplete(prompt, system_instruction, temperature, max_tokens)
+        except Exception as e:
+            self.logger.error(f"Groq API error: {e}")
+            raise
+    
+    def _complete(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """
+        Run a chat completion, serving deterministic requests from the cache.
+        
+        Errors are raised to the caller, which supplies its own fallback.
+        """
+        cache_key = self._cache_key(prompt, system_instruction, temperature, max_tokens)
+        if cache_key is not None and self.cache is not None:
+            response: str = self.cache.get_or_compute(
+                cache_key,
+                lambda: self._create_completion(prompt, system_instruction, temperature, max_tokens)
+            )
+            return response
+        
+        return self._create_completion(prompt, system_instruction, temperature, max_tokens)
+    
+    def _create_completion(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Send a chat completion request, retrying transient errors, and return the stripped text."""
+        completion = call_with_retry(
+            lambda: self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or 4096,
+                messages=self._build_messages(prompt, system_instruction),
+                temperature=temperature,
+                max_tokens=max_tokens,
                 top_p=0.95
+            ),
+            should_retry=lambda e: isinstance(e, RETRYABLE_ERRORS),
+            retry_attempts=self.retry_attempts,
+            retry_delay=self.retry_delay,
+            logger=self.logger
+        )
+        return completion.choices[0].message.content.strip() if completion.choices[0].message.content else ""
+    
+    async def _acomplete(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Asynchronous version of _complete."""
+        cache_key = self._cache_key(prompt, system_instruction, temperature, max_tokens)
+        if cache_key is not None and self.cache is not None:
+            response: str = await self.cache.aget_or_compute(
+                cache_key,
+                lambda: self._acreate_completion(prompt, system_instruction, temperature, max_tokens)
             )
-            return completion.choices[0].message.content.strip() if completion.choices[0].message.content else ""
-        except Exception as e:
-            self.logger.error(f"Groq API error: {str(e)}")
-            return f"Groq response for: {prompt[:50]}..."
+            return response
+        
+        return await self._acreate_completion(prompt, system_instruction, temperature, max_tokens)
+    
+    async def _acreate_completion(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> str:
+        """Asynchronous version of _create_completion."""
+        client = self._get_async_client()
+        completion = await acall_with_retry(
+            lambda: client.chat.completions.create(
+                model=self.model,
+                messages=self._build_messages(prompt, system_instruction),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=0.95
+            ),
+            should_retry=lambda e: isinstance(e, RETRYABLE_ERRORS),
+            retry_attempts=self.retry_attempts,
+            retry_delay=self.retry_delay,
+            logger=self.logger
+        )
+        return completion.choices[0].message.content.strip() if completion.choices[0].message.content else ""
+    
+    def _get_async_client(self) -> AsyncGroq:
+        """
+        Get the async SDK client for the running event loop.
+        
+        Pooled async connections cannot outlive their event loop, and each
+        ESKAI.process call runs its own, so the client is rebuilt whenever
+        the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncGroq(api_key=self.api_key, max_retries=0)
+            self._async_client_loop = loop
+        return self._async_client
+    
+    def stream_response(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_instruction: Optional[str] = None,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Stream a response from the Groq API as it is generated.
+        
+        Cached responses are yielded as a single chunk. Unlike
+        generate_response, errors are raised to the caller.
+        """
+        temperature = self.temperature if temperature is None else temperature
+        max_tokens = max_tokens or 4096
+        
+        cache_key = self._cache_key(prompt, system_instruction, temperature, max_tokens)
+        if cache_key is not None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt, system_instruction),
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=0.95,
+            stream=True
+        )
+        
+        chunks = []
+        for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                chunks.append(content)
+                yield content
+        
+        if cache_key is not None and self.cache is not None:
+            self.cache.set(cache_key, "".join(chunks).strip())
+    
+    def check_health(self, timeout: float = 2.0) -> None:
+        """
+        Check that the API is reachable and the model is served, without spending tokens.
+        
+        Args:
+            timeout: Request timeout in seconds
+        
+        Raises:
+            Exception: If the model metadata cannot be retrieved
+        """
+        self.client.models.retrieve(self.model, timeout=timeout)
+    
+    def _cache_key(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        temperature: float,
+        max_tokens: int
+    ) -> Optional[str]:
+        """Build the response cache key, or None if the request is not cacheable."""
+        if self.cache is None or not self.cache.is_cacheable(temperature):
+            return None
+        return self.cache.make_key(
+            self.model, prompt, system_instruction or "",
+            max_tokens=max_tokens, temperature=temperature
+        )
+    
+    @staticmethod
+    def _build_messages(prompt: str, system_instruction: Optional[str]) -> list:
+        """Build chat messages, leading with the static system instruction."""
+        messages = []
+        if system_instruction:
+            messages.append({"role": "system", "content": system_instruction})
+        messages.append({"role": "user", "content": prompt})
+        return messages
     
     def classify_intent(self, prompt: str) -> str:
         """Classify intent using Groq."""
         try:
-            system_instruction = """
-                You are an intent classifier. Analyze the user's prompt and classify it as either 'chat' 
-                (simple conversation) or 'objective' (task requiring multi-step execution).
-                Return your response in this exact JSON format:
-                {
-                    "intent": "chat" or "objective",
-                    "confidence": float between 0.0 and 1.0,
-                    "reasoning": "brief explanation of classification"
-                }
-            """
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_instruction},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1,
-                max_tokens=500,
-                top_p=0.95
-            )
-            return completion.choices[0].message.content.strip() if completion.choices[0].message.content else ""
+            # Deterministic, so repeated requests are served from the cache
+            return self._complete(prompt, INTENT_SYSTEM_PROMPT, temperature=0.0, max_tokens=500)
+        except Exception as e:
+            self.logger.error(f"Groq intent classification error: {e}")
+            return INTENT_FALLBACK
+    
+    async def aclassify_intent(self, prompt: str) -> str:
+        """Asynchronous version of classify_intent."""
+        try:
+            return await self._acomplete(prompt, INTENT_SYSTEM_PROMPT, temperature=0.0, max_tokens=500)
         except Exception as e:
-            self.logger.error(f"Groq intent classification error: {str(e)}")
-            return '{"intent": "objective", "confidence": 0.8, "reasoning": "Groq classification fallback"}'
+            self.logger.error(f"Groq intent classification error: {e}")
+            return INTENT_FALLBACK
     
     def extract_objectives(self, prompt: str) -> str:
         """Extract objectives using Groq."""
         try:
-            system_instruction = """
-                You are an objective extraction specialist. Analyze the user's prompt and extract clear, 
-                actionable objectives.
-                Return your response in this exact JSON format:
-                {
-                    "primary_objectives": ["main goal 1", "main goal 2"],
-                    "secondary_objectives": ["supporting goal 1", "supporting goal 2"],
-                    "constraints": ["constraint 1", "constraint 2"],
-                    "success_criteria": ["criterion 1", "criterion 2"]
-                }
-            """
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_instruction},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=2000,
-                top_p=0.95
-            )
-            return completion.choices[0].message.content.strip() if completion.choices[0].message.content else ""
+            # Deterministic, so repeated requests are served from the cache
+            return self._complete(prompt, OBJECTIVES_SYSTEM_PROMPT, temperature=0.0, max_tokens=2000)
+        except Exception as e:
+            self.logger.error(f"Groq objective extraction error: {e}")
+            return OBJECTIVES_FALLBACK
+    
+    async def aextract_objectives(self, prompt: str) -> str:
+        """Asynchronous version of extract_objectives."""
+        try:
+            return await self._acomplete(prompt, OBJECTIVES_SYSTEM_PROMPT, temperature=0.0, max_tokens=2000)
         except Exception as e:
-            self.logger.error(f"Groq objective extraction error: {str(e)}")
-            return '{"primary_objectives": [], "secondary_objectives": [], "constraints": [], "success_criteria": []}'
+            self.logger.error(f"Groq objective extraction error: {e}")
+            return OBJECTIVES_FALLBACK
     
     def generate_workflow(self, objectives_data: Dict[str, Any]) -> str:
         """Generate workflow using Groq."""
         try:
-            system_instruction = """
-                You are a workflow generation expert. Based on the provided objectives, create a detailed 
-                step-by-step workflow plan.
-                Return your response in this exact JSON format:
-                {
-                    "workflow_id": "unique_workflow_identifier",
-                    "steps": [
-                        {
-                            "step_id": 1,
-                            "action": "description of action",
-                            "agent_type": "agent type needed",
-                            "expected_output": "what this step should produce",
-                            "dependencies": []
-                        }
-                    ],
-                    "estimated_duration": "time estimate",
-                    "complexity_level": "low/medium/high"
-                }
-            """
             prompt = f"Generate a workflow for these objectives: {objectives_data}"
             
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_instruction},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.4,
-                max_tokens=2000,
-                top_p=0.95
-            )
-            return completion.choices[0].message.content.strip() if completion.choices[0].message.content else ""
+            # Deterministic, so repeated requests are served from the cache
+            return self._complete(prompt, WORKFLOW_SYSTEM_PROMPT, temperature=0.0, max_tokens=2000)
+        except Exception as e:
+            self.logger.error(f"Groq workflow generation error: {e}")
+            return WORKFLOW_FALLBACK
+    
+    async def agenerate_workflow(self, objectives_data: Dict[str, Any]) -> str:
+        """Asynchronous version of generate_workflow."""
+        try:
+            prompt = f"Generate a workflow for these objectives: {objectives_data}"
+            return await self._acomplete(prompt, WORKFLOW_SYSTEM_PROMPT, temperature=0.0, max_tokens=2000)
         except Exception as e:
-            self.logger.error(f"Groq workflow generation error: {str(e)}")
-            return '{"workflow_id": "groq_workflow_fallback", "steps": [], "estimated_duration": "unknown", "complexity_level": "medium"}'
+            self.logger.error(f"Groq workflow generation error: {e}")
+            return WORKFLOW_FALLBACK
     
     def synthesize_results(self, agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
         """Synthesize results using Groq."""
         try:
-            system_instruction = """
-                You are a result synthesis expert. Analyze the agent outputs and original objectives to create a 
-                comprehensive final result.
-
-                Your response should be a well-structured summary that:
-                1. Evaluates how well the objectives were met
-                2. Synthesizes key findings from all agent outputs
-                3. Identifies any gaps or areas for improvement
-                4. Provides actionable next steps if needed
-
-                Return a clear, professional summary."""
-                            
-            prompt = f"""
-                Original Objectives: {original_objectives}
-
-                Agent Outputs: {agent_outputs}
-
-                Please synthesize these results into a comprehensive final report.
-                """
-            
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_instruction},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.2,
-                max_tokens=3000,
-                top_p=0.95
-            )
-            return completion.choices[0].message.content.strip() if completion.choices[0].message.content else ""
+            prompt = self._synthesis_prompt(agent_outputs, original_objectives)
+            return self._create_completion(prompt, SYNTHESIS_SYSTEM_PROMPT, temperature=0.2, max_tokens=3000)
+        except Exception as e:
+            self.logger.error(f"Groq result synthesis error: {e}")
+            return SYNTHESIS_FALLBACK
+    
+    async def asynthesize_results(self, agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
+        """Asynchronous version of synthesize_results."""
+        try:
+            prompt = self._synthesis_prompt(agent_outputs, original_objectives)
+            return await self._acreate_completion(prompt, SYNTHESIS_SYSTEM_PROMPT, temperature=0.2, max_tokens=3000)
         except Exception as e:
-            self.logger.error(f"Groq result synthesis error: {str(e)}")
-            return "Groq synthesis result - fallback due to API error"
+            self.logger.error(f"Groq result synthesis error: {e}")
+            return SYNTHESIS_FALLBACK
+    
+    @staticmethod
+    def _synthesis_prompt(agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
+        """Build the user prompt for synthesize_results, one JSON document per output."""
+        return SYNTHESIS_USER_TEMPLATE.format(
+            original_objectives=dumps(original_objectives),
+            agent_outputs=dumps_joined(agent_outputs)
+        )
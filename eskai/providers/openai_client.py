@@ -2,9 +2,73 @@
 OpenAI API client implementation
 """
 
-from openai import OpenAI
-from typing import Dict, Any, Optional
+import asyncio
+from openai import AsyncOpenAI, OpenAI, APIConnectionError, InternalServerError, RateLimitError
+from typing import AsyncIterator, Dict, Any, Iterator, List, Optional
 from ..utils.logger import get_logger
+from ..utils.llm_cache import LLMCache
+from ..utils.semantic_cache import SemanticCache
+from ..utils.http import get_http_client
+from ..utils.retry import acall_with_retry, call_with_retry
+from ..utils.serialization import dumps, dumps_joined, extract_json_array, strip_code_fence
+
+
+# Rate limits, dropped connections and 5xx responses are worth retrying
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Static instructions for the helper methods, sent as the system message so
+# the request prefix is byte-identical across calls and eligible for prompt
+# caching; only the short user message varies
+CLASSIFICATION_SYSTEM_PROMPT = """
+Classify the user input as either "chat" or "objective".
+
+Return only a JSON object with:
+- intent: "chat" or "objective"
+- confidence: number between 0 and 1
+- reasoning: brief explanation
+"""
+
+CLASSIFICATION_BATCH_SYSTEM_PROMPT = """
+Classify each numbered user input as either "chat" or "objective".
+
+Return only a JSON array with one object per input, in the same order, each with:
+- intent: "chat" or "objective"
+- confidence: number between 0 and 1
+- reasoning: brief explanation
+"""
+
+# Inputs per classify_intent_batch request, keeping the reply within max_tokens
+CLASSIFICATION_BATCH_SIZE = 20
+
+OBJECTIVES_SYSTEM_PROMPT = """
+Extract clear, actionable objectives from the user request.
+
+Return a JSON object with:
+- primary_objectives: list of main objectives
+- secondary_objectives: list of supporting objectives
+- expected_outcomes: list of expected results
+- constraints: list of limitations or requirements
+"""
+
+WORKFLOW_SYSTEM_PROMPT = """
+Create a detailed workflow to achieve the objectives given by the user.
+
+Return a JSON object with:
+- workflow_id: unique identifier
+- steps: list of workflow steps with dependencies
+- critical_path: list of critical steps
+- parallel_groups: groups of steps that can run in parallel
+"""
+
+SYNTHESIS_SYSTEM_PROMPT = """
+Synthesize the agent outputs given by the user into a coherent final result.
+
+Provide a comprehensive synthesis that addresses all objectives.
+"""
+
+SYNTHESIS_USER_TEMPLATE = """Original Objectives: {original_objectives}
+Agent Outputs:
+{agent_outputs}"""
 
 
 class OpenAIClient:
@@ -12,21 +76,39 @@ class OpenAIClient:
     OpenAI API client for ESKAI framework.
     """
     
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini", temperature: float = 0.7):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        cache: Optional[LLMCache] = None,
+        retry_attempts: int = 3,
+        retry_delay: float = 1.0,
+        semantic_cache: Optional[SemanticCache] = None
+    ):
         self.api_key = api_key
         self.model = model
         self.temperature = temperature
+        self.cache = cache
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.semantic_cache = semantic_cache
         self.logger = get_logger("OpenAIClient")
         
-        # Initialize OpenAI client
-        self.client = OpenAI(api_key=api_key)
+        # Initialize OpenAI client; retries are handled by _create_completion
+        self.client = OpenAI(api_key=api_key, http_client=get_http_client(), max_retries=0)
+        
+        # Async connections are bound to an event loop, see _get_async_client
+        self._async_client: Optional[AsyncOpenAI] = None
+        self._async_client_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def generate_response(
         self,
         prompt: str,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
-        **kwargs
+        system_instruction: Optional[str] = None,
+        **kwargs: Any
     ) -> str:
         """
         Generate response using OpenAI API.
@@ -35,26 +117,269 @@ class OpenAIClient:
             prompt: Input prompt
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            system_instruction: Optional static instructions sent ahead of the
+                prompt, keeping the request prefix stable for prompt caching
             **kwargs: Additional parameters
             
         Returns:
             Generated response text
         """
+        temperature = self.temperature if temperature is None else temperature
+        
+        # Exact repeats are served before any embedding work for the semantic cache
+        cache_key = self._cache_key(prompt, system_instruction, max_tokens, temperature, **kwargs)
+        if cache_key is not None and self.cache is not None:
+            response: str = self.cache.get_or_compute(
+                cache_key,
+                lambda: self._complete(prompt, system_instruction, max_tokens, temperature, **kwargs)
+            )
+            return response
+        
+        return self._complete(prompt, system_instruction, max_tokens, temperature, **kwargs)
+    
+    def _complete(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        max_tokens: Optional[int],
+        temperature: float,
+        **kwargs: Any
+    ) -> str:
+        """Run a chat completion, serving near-duplicate deterministic prompts from the semantic cache."""
+        messages = self._build_messages(prompt, system_instruction)
+        if self.semantic_cache is None or not LLMCache.is_cacheable(temperature):
+            return self._create_completion(messages, max_tokens, temperature, **kwargs)
+        
+        namespace = LLMCache.make_key(
+            self.model, "", system_instruction or "",
+            max_tokens=max_tokens, temperature=temperature, **kwargs
+        )
+        embedding = self.semantic_cache.embed(prompt)
+        response = self.semantic_cache.get(namespace, embedding)
+        if response is None:
+            response = self._create_completion(messages, max_tokens, temperature, **kwargs)
+            self.semantic_cache.set(namespace, embedding, response)
+        return response
+    
+    async def agenerate_response(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_instruction: Optional[str] = None,
+        **kwargs: Any
+    ) -> str:
+        """
+        Asynchronous version of generate_response.
+        
+        Uses the AsyncOpenAI SDK, so concurrent requests can be gathered on
+        one event loop instead of each occupying a thread.
+        """
+        temperature = self.temperature if temperature is None else temperature
+        messages = self._build_messages(prompt, system_instruction)
+        
+        cache_key = self._cache_key(prompt, system_instruction, max_tokens, temperature, **kwargs)
+        if cache_key is not None and self.cache is not None:
+            response: str = await self.cache.aget_or_compute(
+                cache_key,
+                lambda: self._acreate_completion(messages, max_tokens, temperature, **kwargs)
+            )
+            return response
+        
+        return await self._acreate_completion(messages, max_tokens, temperature, **kwargs)
+    
+    def _create_completion(
+        self,
+        messages: list,
+        max_tokens: Optional[int],
+        temperature: float,
+        **kwargs: Any
+    ) -> str:
+        """Send a chat completion request, retrying transient errors, and return the stripped text."""
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=max_tokens,
-                temperature=temperature or self.temperature,
-                **kwargs
+            response = call_with_retry(
+                lambda: self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                ),
+                should_retry=lambda e: isinstance(e, RETRYABLE_ERRORS),
+                retry_attempts=self.retry_attempts,
+                retry_delay=self.retry_delay,
+                logger=self.logger
             )
             
-            return response.choices[0].message.content.strip()
+            # Tool call and refusal replies carry no content
+            content: str = response.choices[0].message.content or ""
+            return content.strip()
             
         except Exception as e:
-            self.logger.error(f"OpenAI API error: {str(e)}")
+            self.logger.error(f"OpenAI API error: {e}")
             raise
     
+    async def _acreate_completion(
+        self,
+        messages: list,
+        max_tokens: Optional[int],
+        temperature: float,
+        **kwargs: Any
+    ) -> str:
+        """Asynchronous version of _create_completion."""
+        client = self._get_async_client()
+        try:
+            response = await acall_with_retry(
+                lambda: client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    **kwargs
+                ),
+                should_retry=lambda e: isinstance(e, RETRYABLE_ERRORS),
+                retry_attempts=self.retry_attempts,
+                retry_delay=self.retry_delay,
+                logger=self.logger
+            )
+            
+            content: str = response.choices[0].message.content or ""
+            return content.strip()
+            
+        except Exception as e:
+            self.logger.error(f"OpenAI API error: {e}")
+            raise
+    
+    def _get_async_client(self) -> AsyncOpenAI:
+        """
+        Get the async SDK client for the running event loop.
+        
+        Pooled async connections cannot outlive their event loop, and each
+        ESKAI.process call runs its own, so the client is rebuilt whenever
+        the loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, max_retries=0)
+            self._async_client_loop = loop
+        return self._async_client
+    
+    def stream_response(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_instruction: Optional[str] = None,
+        **kwargs: Any
+    ) -> Iterator[str]:
+        """
+        Stream a response from the OpenAI API as it is generated.
+        
+        Cached responses are yielded as a single chunk. Errors are raised to
+        the caller; transient errors are not retried once streaming started.
+        """
+        temperature = self.temperature if temperature is None else temperature
+        
+        cache_key = self._cache_key(prompt, system_instruction, max_tokens, temperature, **kwargs)
+        if cache_key is not None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt, system_instruction),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            **kwargs
+        )
+        
+        chunks = []
+        for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                chunks.append(content)
+                yield content
+        
+        if cache_key is not None and self.cache is not None:
+            self.cache.set(cache_key, "".join(chunks).strip())
+    
+    async def astream_response(
+        self,
+        prompt: str,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        system_instruction: Optional[str] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Asynchronous version of stream_response, using the AsyncOpenAI SDK."""
+        temperature = self.temperature if temperature is None else temperature
+        
+        cache_key = self._cache_key(prompt, system_instruction, max_tokens, temperature, **kwargs)
+        if cache_key is not None and self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+        
+        stream = await self._get_async_client().chat.completions.create(
+            model=self.model,
+            messages=self._build_messages(prompt, system_instruction),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            **kwargs
+        )
+        
+        chunks = []
+        async for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                chunks.append(content)
+                yield content
+        
+        if cache_key is not None and self.cache is not None:
+            self.cache.set(cache_key, "".join(chunks).strip())
+    
+    def check_health(self, timeout: float = 2.0) -> None:
+        """
+        Check that the API is reachable and the model is served, without spending tokens.
+        
+        Args:
+            timeout: Request timeout in seconds
+        
+        Raises:
+            Exception: If the model metadata cannot be retrieved
+        """
+        self.client.models.retrieve(self.model, timeout=timeout)
+    
+    def _cache_key(
+        self,
+        prompt: str,
+        system_instruction: Optional[str],
+        max_tokens: Optional[int],
+        temperature: float,
+        **kwargs: Any
+    ) -> Optional[str]:
+        """Build the response cache key, or None if the request is not cacheable."""
+        if self.cache is None or not self.cache.is_cacheable(temperature):
+            return None
+        return self.cache.make_key(
+            self.model, prompt, system_instruction or "",
+            max_tokens=max_tokens, temperature=temperature, **kwargs
+        )
+    
+    @staticmethod
+    def _build_messages(prompt: str, system_instruction: Optional[str]) -> list:
+        """Build chat messages, leading with the static system instruction."""
+        messages = []
+        if system_instruction:
+            messages.append({"role": "system", "content": system_instruction})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+    
     def classify_intent(self, prompt: str) -> str:
         """
         Classify intent using OpenAI.
@@ -65,24 +390,59 @@ class OpenAIClient:
         Returns:
             Classification result as JSON string
         """
-        classification_prompt = f"""
-        Classify the following user input as either "chat" or "objective":
-        
-        Input: "{prompt}"
-        
-        Return only a JSON object with:
-        - intent: "chat" or "objective"
-        - confidence: number between 0 and 1
-        - reasoning: brief explanation
-        """
-        
-        response = self.generate_response(
-            classification_prompt,
+        return self.generate_response(
+            f'Input: "{prompt}"',
+            system_instruction=CLASSIFICATION_SYSTEM_PROMPT,
+            max_tokens=150,
+            temperature=0.1
+        )
+    
+    async def aclassify_intent(self, prompt: str) -> str:
+        """Asynchronous version of classify_intent."""
+        return await self.agenerate_response(
+            f'Input: "{prompt}"',
+            system_instruction=CLASSIFICATION_SYSTEM_PROMPT,
             max_tokens=150,
             temperature=0.1
         )
+    
+    def classify_intent_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Classify several inputs with one request per CLASSIFICATION_BATCH_SIZE inputs.
         
-        return response
+        Inputs the batched reply does not cover, e.g. because it could not be
+        parsed or was cut short, are classified individually.
+        
+        Args:
+            prompts: Input prompts to classify
+            
+        Returns:
+            Classification results as JSON strings, in the order of prompts
+        """
+        results = []
+        for offset in range(0, len(prompts), CLASSIFICATION_BATCH_SIZE):
+            batch = prompts[offset:offset + CLASSIFICATION_BATCH_SIZE]
+            numbered = "\n".join(f'{i}. "{prompt}"' for i, prompt in enumerate(batch, 1))
+            
+            try:
+                response = self.generate_response(
+                    numbered,
+                    system_instruction=CLASSIFICATION_BATCH_SYSTEM_PROMPT,
+                    max_tokens=150 * len(batch),
+                    temperature=0.1
+                )
+                classifications = extract_json_array(strip_code_fence(response)) or []
+            except Exception as e:
+                self.logger.warning(f"Batch classification failed, classifying individually: {e}")
+                classifications = []
+            
+            for i, prompt in enumerate(batch):
+                if i < len(classifications) and isinstance(classifications[i], dict):
+                    results.append(dumps(classifications[i]))
+                else:
+                    results.append(self.classify_intent(prompt))
+        
+        return results
     
     def extract_objectives(self, prompt: str) -> str:
         """
@@ -94,20 +454,18 @@ class OpenAIClient:
         Returns:
             Extracted objectives
         """
-        objectives_prompt = f"""
-        Extract clear, actionable objectives from this user request:
-        
-        Request: "{prompt}"
-        
-        Return a JSON object with:
-        - primary_objectives: list of main objectives
-        - secondary_objectives: list of supporting objectives
-        - expected_outcomes: list of expected results
-        - constraints: list of limitations or requirements
-        """
-        
         return self.generate_response(
-            objectives_prompt,
+            f'Request: "{prompt}"',
+            system_instruction=OBJECTIVES_SYSTEM_PROMPT,
+            max_tokens=500,
+            temperature=0.3
+        )
+    
+    async def aextract_objectives(self, prompt: str) -> str:
+        """Asynchronous version of extract_objectives."""
+        return await self.agenerate_response(
+            f'Request: "{prompt}"',
+            system_instruction=OBJECTIVES_SYSTEM_PROMPT,
             max_tokens=500,
             temperature=0.3
         )
@@ -122,20 +480,18 @@ class OpenAIClient:
         Returns:
             Generated workflow
         """
-        workflow_prompt = f"""
-        Create a detailed workflow to achieve these objectives:
-        
-        Objectives: {objectives_data}
-        
-        Return a JSON object with:
-        - workflow_id: unique identifier
-        - steps: list of workflow steps with dependencies
-        - critical_path: list of critical steps
-        - parallel_groups: groups of steps that can run in parallel
-        """
-        
         return self.generate_response(
-            workflow_prompt,
+            f"Objectives: {objectives_data}",
+            system_instruction=WORKFLOW_SYSTEM_PROMPT,
+            max_tokens=1000,
+            temperature=0.3
+        )
+    
+    async def agenerate_workflow(self, objectives_data: Dict[str, Any]) -> str:
+        """Asynchronous version of generate_workflow."""
+        return await self.agenerate_response(
+            f"Objectives: {objectives_data}",
+            system_instruction=WORKFLOW_SYSTEM_PROMPT,
             max_tokens=1000,
             temperature=0.3
         )
@@ -151,17 +507,26 @@ class OpenAIClient:
         Returns:
             Synthesized result
         """
-        synthesis_prompt = f"""
-        Synthesize these agent outputs into a coherent final result:
-        
-        Original Objectives: {original_objectives}
-        Agent Outputs: {agent_outputs}
-        
-        Provide a comprehensive synthesis that addresses all objectives.
-        """
-        
         return self.generate_response(
-            synthesis_prompt,
+            self._synthesis_prompt(agent_outputs, original_objectives),
+            system_instruction=SYNTHESIS_SYSTEM_PROMPT,
+            max_tokens=2000,
+            temperature=0.4
+        )
+    
+    async def asynthesize_results(self, agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
+        """Asynchronous version of synthesize_results."""
+        return await self.agenerate_response(
+            self._synthesis_prompt(agent_outputs, original_objectives),
+            system_instruction=SYNTHESIS_SYSTEM_PROMPT,
             max_tokens=2000,
             temperature=0.4
         )
+    
+    @staticmethod
+    def _synthesis_prompt(agent_outputs: list, original_objectives: Dict[str, Any]) -> str:
+        """Build the user prompt for synthesize_results, one JSON document per output."""
+        return SYNTHESIS_USER_TEMPLATE.format(
+            original_objectives=dumps(original_objectives),
+            agent_outputs=dumps_joined(agent_outputs)
+        )
@@ -2,64 +2,118 @@
 Provider Manager for handling multiple AI providers
 """
 
-from typing import Dict, Any, Optional, List
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional, List, Tuple, Union
 from ..utils.logger import get_logger
-from .openai_client import OpenAIClient
-from .groq_client import GroqClient
-from .gemini_client import GeminiClient
+from ..utils.llm_cache import LLMCache
+from ..utils.scheduling import dependency_batches
+from ..utils.semantic_cache import SemanticCache
+from ..utils.serialization import extract_json_object
 
 
+# Provider preference order, used for primary selection and multi-provider fan-out
+PROVIDER_PRIORITY = ("openai", "groq", "gemini")
+
 class ProviderManager:
     """
     Manages multiple AI providers and handles failover.
     """
     
+    # Weight of the newest sample in the per-provider latency average
+    LATENCY_EWMA_ALPHA = 0.2
+    # A provider failing more than this often within the window is tried last
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_WINDOW_SECONDS = 60.0
+    
     def __init__(self, config):
         self.config = config
         self.logger = get_logger("ProviderManager", level=config.log_level)
         self.providers = {}
         
+        # Shared cache for deterministic (low temperature) responses
+        self.response_cache = LLMCache() if config.cache_responses else None
+        self.semantic_cache = self._create_semantic_cache()
+        
+        # Outcome of the latest failover request per provider, for get_provider_status
+        self._last_success: Dict[str, float] = {}
+        self._last_failure: Dict[str, Tuple[float, str]] = {}
+        
+        # Measured latency and reliability per provider, for _failover_order
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+        
         # Initialize available providers
         self._initialize_providers()
     
+    def _create_semantic_cache(self) -> Optional[SemanticCache]:
+        """Create the similarity cache if enabled and its dependencies are installed."""
+        if not self.config.semantic_cache:
+            return None
+        if not SemanticCache.is_available():
+            self.logger.warning("semantic_cache is enabled but sentence-transformers is not installed (pip install eskai[semantic])")
+            return None
+        return SemanticCache(threshold=self.config.semantic_cache_threshold)
+    
     def _initialize_providers(self):
-        """Initialize all available providers."""
+        """
+        Initialize all available providers.
+        
+        Each provider SDK is imported only when its API key is configured,
+        so unused SDKs cost no import time or memory.
+        """
         
         # OpenAI
         if self.config.openai_api_key:
             try:
+                from .openai_client import OpenAIClient
                 self.providers["openai"] = OpenAIClient(
                     api_key=self.config.openai_api_key,
                     model=self.config.openai_model,
-                    temperature=self.config.temperature
+                    temperature=self.config.temperature,
+                    cache=self.response_cache,
+                    retry_attempts=self.config.retry_attempts,
+                    retry_delay=self.config.retry_delay,
+                    semantic_cache=self.semantic_cache
                 )
                 self.logger.info("OpenAI provider initialized")
             except Exception as e:
-                self.logger.warning(f"Failed to initialize OpenAI provider: {str(e)}")
+                self.logger.warning(f"Failed to initialize OpenAI provider: {e}")
         
         # Groq
         if self.config.groq_api_key:
             try:
+                from .groq_client import GroqClient
                 self.providers["groq"] = GroqClient(
                     api_key=self.config.groq_api_key,
                     model=self.config.groq_model,
-                    temperature=self.config.temperature
+                    temperature=self.config.temperature,
+                    cache=self.response_cache,
+                    retry_attempts=self.config.retry_attempts,
+                    retry_delay=self.config.retry_delay
                 )
                 self.logger.info("Groq provider initialized")
             except Exception as e:
-                self.logger.warning(f"Failed to initialize Groq provider: {str(e)}")
+                self.logger.warning(f"Failed to initialize Groq provider: {e}")
         
         # Gemini
         if self.config.gemini_api_key:
             try:
+                from .gemini_client import GeminiClient
                 self.providers["gemini"] = GeminiClient(
                     api_key=self.config.gemini_api_key,
                     model=self.config.gemini_model,
-                    temperature=self.config.temperature
+                    temperature=self.config.temperature,
+                    cache=self.response_cache,
+                    retry_attempts=self.config.retry_attempts,
+                    retry_delay=self.config.retry_delay
                 )
                 self.logger.info("Gemini provider initialized")
             except Exception as e:
-                self.logger.warning(f"Failed to initialize Gemini provider: {str(e)}")
+                self.logger.warning(f"Failed to initialize Gemini provider: {e}")
         
         if not self.providers:
             raise RuntimeError("No AI providers could be initialized. Please check your API keys.")
@@ -85,14 +139,11 @@ class ProviderManager:
         Returns:
             Primary provider instance
         """
-        if "openai" in self.providers:
-            return self.providers["openai"]
-        elif "groq" in self.providers:
-            return self.providers["groq"]
-        elif "gemini" in self.providers:
-            return self.providers["gemini"]
-        else:
-            raise RuntimeError("No providers available")
+        for provider_name in PROVIDER_PRIORITY:
+            if provider_name in self.providers:
+                return self.providers[provider_name]
+        
+        raise RuntimeError("No providers available")
     
     def get_all_providers(self) -> List[Any]:
         """
@@ -103,10 +154,15 @@ class ProviderManager:
         """
         return list(self.providers.values())
     
-    def generate_with_failover(self, prompt: str, **kwargs) -> str:
+    def generate_with_failover(self, prompt: str, **kwargs: Any) -> str:
         """
         Generate response with automatic failover between providers.
         
+        Providers are tried fastest and most reliable first (see
+        _failover_order). When config.llm_hedge is enabled, the first two
+        are raced (see _generate_hedged) before falling back to sequential
+        failover.
+        
         Args:
             prompt: The input prompt
             **kwargs: Additional parameters for generation
@@ -115,44 +171,334 @@ class ProviderManager:
             Generated response
         """
         last_error = None
+        already_tried = set()
+        
+        order = self._failover_order()
+        
+        if self.config.llm_hedge and len(order) > 1:
+            try:
+                return self._generate_hedged(prompt, order[0], order[1], **kwargs)
+            except Exception as e:
+                last_error = e
+                already_tried.update(order[:2])
+                self.logger.warning(f"Hedged generation failed, falling back to sequential failover: {e}")
         
-        for provider_name, provider in self.providers.items():
+        for provider_name in order:
+            if provider_name in already_tried:
+                continue
+            provider = self.providers[provider_name]
             try:
                 self.logger.debug(f"Attempting generation with {provider_name}")
-                response = provider.generate_response(prompt, **kwargs)
+                start = time.perf_counter()
+                response: str = provider.generate_response(prompt, **kwargs)
+                self.logger.debug(f"Successful generation with {provider_name}")
+                self._record_success(provider_name, time.perf_counter() - start)
+                return response
+            except Exception as e:
+                last_error = e
+                self.logger.warning(f"Provider {provider_name} failed: {e}")
+                self._record_failure(provider_name, e)
+                continue
+        
+        # If all providers failed
+        raise RuntimeError(f"All providers failed. Last error: {last_error}")
+    
+    async def agenerate_with_failover(self, prompt: str, **kwargs: Any) -> str:
+        """
+        Asynchronous version of generate_with_failover.
+        
+        Providers are tried in _failover_order through their agenerate_response method;
+        providers without one run generate_response in a worker thread.
+        Hedging is not applied.
+        
+        Args:
+            prompt: The input prompt
+            **kwargs: Additional parameters for generation
+            
+        Returns:
+            Generated response
+        """
+        last_error = None
+        
+        for provider_name in self._failover_order():
+            provider = self.providers[provider_name]
+            try:
+                self.logger.debug(f"Attempting async generation with {provider_name}")
+                start = time.perf_counter()
+                if hasattr(provider, "agenerate_response"):
+                    response: str = await provider.agenerate_response(prompt, **kwargs)
+                else:
+                    response = await asyncio.to_thread(provider.generate_response, prompt, **kwargs)
                 self.logger.debug(f"Successful generation with {provider_name}")
+                self._record_success(provider_name, time.perf_counter() - start)
                 return response
             except Exception as e:
                 last_error = e
-                self.logger.warning(f"Provider {provider_name} failed: {str(e)}")
+                self.logger.warning(f"Provider {provider_name} failed: {e}")
+                self._record_failure(provider_name, e)
                 continue
         
         # If all providers failed
-        raise RuntimeError(f"All providers failed. Last error: {str(last_error)}")
+        raise RuntimeError(f"All providers failed. Last error: {last_error}")
+    
+    async def agenerate_many(self, prompts: List[str], **kwargs: Any) -> List[str]:
+        """
+        Generate responses for independent prompts concurrently.
+        
+        Args:
+            prompts: Input prompts
+            **kwargs: Additional parameters for generation, shared by all prompts
+            
+        Returns:
+            Responses in the same order as prompts
+        """
+        return await asyncio.gather(
+            *(self.agenerate_with_failover(prompt, **kwargs) for prompt in prompts)
+        )
+    
+    def run_workflow(self, workflow: Union[str, Dict[str, Any]], **kwargs: Any) -> Dict[str, str]:
+        """
+        Generate a response for every step of a workflow.
+        
+        Steps run in dependency phases (see dependency_batches); the steps of
+        a phase are independent and run concurrently in worker threads.
+        
+        Args:
+            workflow: Workflow from generate_workflow, as JSON text or a dict
+            **kwargs: Additional parameters for generation, shared by all steps
+        
+        Returns:
+            Response per step id
+        """
+        results: Dict[str, str] = {}
+        for batch in dependency_batches(self._workflow_steps(workflow), "step_id", self.logger):
+            with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+                responses = pool.map(
+                    lambda step: self.generate_with_failover(step["prompt"], **kwargs), batch
+                )
+                results.update(zip((step["step_id"] for step in batch), responses))
+        return results
+    
+    async def arun_workflow(self, workflow: Union[str, Dict[str, Any]], **kwargs: Any) -> Dict[str, str]:
+        """Asynchronous version of run_workflow; phases are gathered on the event loop."""
+        results: Dict[str, str] = {}
+        for batch in dependency_batches(self._workflow_steps(workflow), "step_id", self.logger):
+            responses = await self.agenerate_many([step["prompt"] for step in batch], **kwargs)
+            results.update(zip((step["step_id"] for step in batch), responses))
+        return results
+    
+    @staticmethod
+    def _workflow_steps(workflow: Union[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Normalize the steps of a generated workflow.
+        
+        Args:
+            workflow: Workflow as JSON text or a dict
+        
+        Returns:
+            Steps with step_id, prompt and dependencies
+        
+        Raises:
+            ValueError: If the workflow has no parseable steps, or a step has no text
+        """
+        parsed = extract_json_object(workflow) if isinstance(workflow, str) else workflow
+        if not parsed or not isinstance(parsed.get("steps"), list):
+            raise ValueError("Workflow has no steps")
+        
+        steps = []
+        for index, step in enumerate(parsed["steps"], 1):
+            if not isinstance(step, dict):
+                step = {"description": str(step)}
+            step_id = str(step.get("step_id") or step.get("id") or f"step_{index}")
+            # Groq writes each step's text under "action", Gemini under "description"
+            prompt = step.get("prompt") or step.get("action") or step.get("description") or step.get("name")
+            if not prompt:
+                raise ValueError(f"Workflow step {step_id} has no prompt")
+            steps.append({
+                "step_id": step_id,
+                "prompt": str(prompt),
+                "dependencies": [str(dep) for dep in step.get("dependencies") or []]
+            })
+        return steps
+    
+    def _generate_hedged(self, prompt: str, primary_name: str, fallback_name: str, **kwargs: Any) -> str:
+        """
+        Race the primary provider against a fallback provider.
+        
+        The primary runs alone for config.hedge_delay_ms. If it has not
+        succeeded by then, the fallback is started as well and the first
+        successful response wins; the slower request is abandoned.
+        
+        Args:
+            prompt: The input prompt
+            primary_name: Provider started first
+            fallback_name: Provider started once the hedge delay has passed
+            **kwargs: Additional parameters for generation
+            
+        Returns:
+            Generated response from the faster provider
+        """
+        pool = ThreadPoolExecutor(max_workers=2)
+        
+        try:
+            primary_start = time.perf_counter()
+            primary = pool.submit(self.providers[primary_name].generate_response, prompt, **kwargs)
+            done, _ = wait({primary}, timeout=self.config.hedge_delay_ms / 1000)
+            if done and primary.exception() is None:
+                self._record_success(primary_name, time.perf_counter() - primary_start)
+                response: str = primary.result()
+                return response
+            
+            self.logger.debug(f"Hedging {primary_name} with {fallback_name}")
+            hedge_start = time.perf_counter()
+            hedge = pool.submit(self.providers[fallback_name].generate_response, prompt, **kwargs)
+            names = {primary: primary_name, hedge: fallback_name}
+            starts = {primary: primary_start, hedge: hedge_start}
+            
+            pending = {primary, hedge}
+            last_error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        for loser in pending:
+                            loser.cancel()
+                        self._record_success(names[future], time.perf_counter() - starts[future])
+                        winner: str = future.result()
+                        return winner
+                    last_error = error
+                    self._record_failure(names[future], error)
+            
+            raise RuntimeError(f"Hedged providers failed. Last error: {last_error}")
+        finally:
+            pool.shutdown(wait=False)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss statistics of the response caches.
+        
+        Returns:
+            Dictionary with statistics per enabled cache
+        """
+        stats = {}
+        for name, cache in (("response_cache", self.response_cache), ("semantic_cache", self.semantic_cache)):
+            if cache is not None:
+                lookups = cache.hits + cache.misses
+                stats[name] = {
+                    "entries": len(cache),
+                    "hits": cache.hits,
+                    "misses": cache.misses,
+                    "hit_rate": cache.hits / lookups if lookups else 0.0
+                }
+        return stats
     
-    def get_provider_status(self) -> Dict[str, Any]:
+    def get_provider_status(self, deep: bool = False) -> Dict[str, Any]:
         """
         Get status of all providers.
         
+        By default this reports the outcome of the latest failover request
+        to each provider without any API call. With deep=True each provider
+        is probed through its lightweight model metadata endpoint, which
+        costs no tokens.
+        
+        Args:
+            deep: Whether to probe each provider's API
+        
         Returns:
             Dictionary with provider status information
         """
         status = {}
         
         for name, provider in self.providers.items():
-            try:
-                # Try a simple test to check if provider is working
-                test_response = provider.generate_response("Test", max_tokens=1)
+            if deep:
+                try:
+                    provider.check_health()
+                    self._record_success(name)
+                except Exception as e:
+                    self._record_failure(name, e)
+            
+            last_success = self._last_success.get(name)
+            last_failure = self._last_failure.get(name)
+            
+            if last_failure is not None and (last_success is None or last_failure[0] > last_success):
                 status[name] = {
-                    "available": True,
-                    "model": getattr(provider, 'model', 'unknown'),
-                    "last_test": "success"
+                    "available": False,
+                    "error": last_failure[1],
+                    "last_test": "failed",
+                    "last_failure": last_failure[0]
                 }
-            except Exception as e:
+            else:
                 status[name] = {
-                    "available": False,
-                    "error": str(e),
-                    "last_test": "failed"
+                    "available": True,
+                    "model": getattr(provider, 'model', 'unknown'),
+                    "last_test": "success" if last_success is not None else "not_tested",
+                    "last_success": last_success
                 }
         
         return status
+    
+    def _failover_order(self) -> List[str]:
+        """
+        Order providers for failover by expected cost.
+        
+        Providers whose circuit is open (more than CIRCUIT_FAILURE_THRESHOLD
+        failures within CIRCUIT_WINDOW_SECONDS) go last but are still tried,
+        then higher success rate and lower average latency win. Unmeasured
+        providers count as reliable but slow, so they keep their
+        configuration order behind providers with a good track record.
+        
+        Returns:
+            Provider names in the order to try them
+        """
+        now = time.monotonic()
+        
+        def expected_cost(provider_name: str) -> Tuple[bool, float, float]:
+            stats = self._stats.get(provider_name)
+            if stats is None:
+                return (False, -1.0, float("inf"))
+            
+            recent = stats["recent_failures"]
+            circuit_open = sum(1 for t in recent if now - t <= self.CIRCUIT_WINDOW_SECONDS) > self.CIRCUIT_FAILURE_THRESHOLD
+            attempts = stats["successes"] + stats["failures"]
+            success_rate = stats["successes"] / attempts if attempts else 1.0
+            latency = stats["ewma_seconds"] if stats["ewma_seconds"] is not None else float("inf")
+            return (circuit_open, -success_rate, latency)
+        
+        with self._stats_lock:
+            return sorted(self.providers, key=expected_cost)
+    
+    def _provider_stats(self, provider_name: str) -> Dict[str, Any]:
+        """Get the mutable statistics entry of a provider; call with _stats_lock held."""
+        stats = self._stats.get(provider_name)
+        if stats is None:
+            stats = self._stats[provider_name] = {
+                "ewma_seconds": None,
+                "successes": 0,
+                "failures": 0,
+                "recent_failures": deque(maxlen=self.CIRCUIT_FAILURE_THRESHOLD + 1)
+            }
+        return stats
+    
+    def _record_success(self, provider_name: str, latency: Optional[float] = None) -> None:
+        """Remember that a provider just answered successfully, and how fast."""
+        self._last_success[provider_name] = time.time()
+        
+        with self._stats_lock:
+            stats = self._provider_stats(provider_name)
+            stats["successes"] += 1
+            if latency is not None:
+                if stats["ewma_seconds"] is None:
+                    stats["ewma_seconds"] = latency
+                else:
+                    alpha = self.LATENCY_EWMA_ALPHA
+                    stats["ewma_seconds"] = (1 - alpha) * stats["ewma_seconds"] + alpha * latency
+    
+    def _record_failure(self, provider_name: str, error: BaseException) -> None:
+        """Remember that a provider just failed."""
+        self._last_failure[provider_name] = (time.time(), str(error))
+        
+        with self._stats_lock:
+            stats = self._provider_stats(provider_name)
+            stats["failures"] += 1
+            stats["recent_failures"].append(time.monotonic())
@@ -4,5 +4,6 @@ Utilities package for ESKAI
 
 from .config import ESKAIConfig, get_default_config
 from .logger import get_logger, ExecutionTracker
+from .embedding import get_encoder, embed
 
-__all__ = ["ESKAIConfig", "get_default_config", "get_logger", "ExecutionTracker"]
+__all__ = ["ESKAIConfig", "get_default_config", "get_logger", "ExecutionTracker", "get_encoder", "embed"]
@@ -2,15 +2,156 @@
 Configuration management for ESKAI
 """
 
+import json
 import os
-import yaml
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import FrozenInstanceError, asdict, dataclass, field
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
+from .logger import LOG_LEVELS
 
 load_dotenv()  # Load environment variables from .env file
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10; older interpreters get a plain dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Parsed YAML per absolute path, with the (mtime, size) it was parsed at
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+_YAML_CACHE_SIZE = 100
+_YAML_CACHE_LOCK = threading.Lock()
+
+# Set to skip the <config>.cache.json sidecar, e.g. while editing configs
+DISABLE_YAML_CACHE_ENV = "ESKAI_DISABLE_YAML_CACHE"
+
+
+def _load_yaml(config_path: str) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while the file is unchanged.
+    
+    The file is re-read whenever its modification time or size changes.
+    The returned data is shared between callers and must not be mutated.
+    
+    Args:
+        config_path: Path to the YAML file
+        
+    Returns:
+        Parsed YAML document
+    """
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _YAML_CACHE.move_to_end(path)
+            return cached[2]
+    
+    data = _read_config_file(path, st)
+    
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+        _YAML_CACHE.move_to_end(path)
+        while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
+    
+    return data
+
+
+def _read_config_file(path: str, st: os.stat_result) -> Any:
+    """
+    Parse a YAML file, going through its JSON sidecar when possible.
+    
+    A parsed document is written to <path>.cache.json together with the
+    YAML file's mtime and size, and later processes load it instead while
+    both still match exactly, so replacing the YAML with an older file
+    (cp -p, tar, rsync -t, backups) is noticed too. The sidecar is skipped
+    when ESKAI_DISABLE_YAML_CACHE is set, and is not written for documents
+    JSON cannot represent faithfully or for read-only directories.
+    
+    Args:
+        path: Absolute path to the YAML file
+        st: Result of os.stat for the YAML file
+        
+    Returns:
+        Parsed YAML document
+    """
+    use_sidecar = not os.getenv(DISABLE_YAML_CACHE_ENV)
+    sidecar_path = path + ".cache.json"
+    
+    if use_sidecar:
+        try:
+            with open(sidecar_path, 'rb') as f:
+                sidecar = json.load(f)
+            if (isinstance(sidecar, dict)
+                    and sidecar.get("source_mtime_ns") == st.st_mtime_ns
+                    and sidecar.get("source_size") == st.st_size
+                    and "data" in sidecar):
+                return sidecar["data"]
+        except (OSError, ValueError):
+            pass  # Missing or unreadable sidecar; parse the YAML instead
+    
+    # Imported here so `import eskai` does not pay for PyYAML
+    import yaml
+    
+    # libyaml's C loader is only present when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=loader)
+    
+    if use_sidecar and _has_only_str_keys(data):
+        sidecar = {"source_mtime_ns": st.st_mtime_ns, "source_size": st.st_size, "data": data}
+        tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(sidecar, f)
+            os.replace(tmp_path, sidecar_path)
+        except (OSError, TypeError, ValueError):
+            # Dates and other YAML-only values have no JSON form
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
+    return data
+
+
+def _has_only_str_keys(data: Any) -> bool:
+    """Check that every mapping in a document has string keys, as JSON requires."""
+    if isinstance(data, dict):
+        return all(isinstance(key, str) and _has_only_str_keys(value) for key, value in data.items())
+    if isinstance(data, list):
+        return all(_has_only_str_keys(item) for item in data)
+    return True
+
+
+# Config file layout: (section path, key, ESKAIConfig field, default if the key
+# is missing). Keys are only read from sections present in the file.
+_FILE_SCHEMA = (
+    (('providers', 'openai'), 'model', 'openai_model', 'gpt-4'),
+    (('providers', 'openai'), 'temperature', 'temperature', 0.7),
+    (('providers', 'groq'), 'model', 'groq_model', 'mixtral-8x7b-32768'),
+    (('providers', 'gemini'), 'model', 'gemini_model', 'gemini-pro'),
+    (('execution',), 'max_concurrent_agents', 'max_concurrent_agents', 3),
+    (('execution',), 'timeout_seconds', 'default_timeout', 3600),
+    (('execution',), 'enable_parallel_execution', 'enable_parallel_execution', True),
+    (('execution',), 'llm_hedge', 'llm_hedge', False),
+    (('execution',), 'hedge_delay_ms', 'hedge_delay_ms', 500),
+    (('execution',), 'combined_assessment', 'combined_assessment', False),
+    (('execution',), 'speculative_objectives', 'speculative_objectives', False),
+    (('execution',), 'semantic_cache', 'semantic_cache', False),
+    (('execution',), 'semantic_cache_threshold', 'semantic_cache_threshold', 0.92),
+    (('tools',), 'enable_internet', 'enable_internet', True),
+    (('tools',), 'enable_code_execution', 'enable_code_execution', True),
+    (('tools',), 'enable_file_operations', 'enable_file_operations', True),
+    (('logging',), 'level', 'log_level', 'INFO'),
+    (('logging',), 'file', 'log_file', 'eskai.log'),
+)
+
+
+@dataclass(**_SLOTS)
 class ESKAIConfig:
     """
     Configuration class for ESKAI framework.
@@ -50,6 +191,12 @@ class ESKAIConfig:
     retry_attempts: int = 3
     retry_delay: float = 1.0
     cache_responses: bool = True
+    llm_hedge: bool = False  # Race a fallback provider against a slow primary
+    hedge_delay_ms: int = 500  # How long the primary runs alone before hedging
+    combined_assessment: bool = False  # Extract objectives in the Layer 1 provider calls
+    speculative_objectives: bool = False  # Run Layer 2 alongside uncertain Layer 1 assessments (extra provider calls)
+    semantic_cache: bool = False  # Reuse responses for near-duplicate prompts (needs sentence-transformers)
+    semantic_cache_threshold: float = 0.92  # Minimum cosine similarity for a semantic cache hit
     
     @classmethod
     def from_file(cls, config_path: str) -> "ESKAIConfig":
@@ -65,49 +212,17 @@ class ESKAIConfig:
         if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+        config_data = _load_yaml(config_path)
         
-        # Extract ESKAI-specific configuration
+        # Flatten the nested 'eskai' sections into dataclass fields
         eskai_config = config_data.get('eskai', {})
-        
-        # Flatten nested configuration
         flat_config = {}
-        
-        # Provider settings
-        providers = eskai_config.get('providers', {})
-        if 'openai' in providers:
-            flat_config.update({
-                'openai_model': providers['openai'].get('model', 'gpt-4'),
-                'temperature': providers['openai'].get('temperature', 0.7)
-            })
-        if 'groq' in providers:
-            flat_config['groq_model'] = providers['groq'].get('model', 'mixtral-8x7b-32768')
-        if 'gemini' in providers:
-            flat_config['gemini_model'] = providers['gemini'].get('model', 'gemini-pro')
-        
-        # Execution settings
-        execution = eskai_config.get('execution', {})
-        flat_config.update({
-            'max_concurrent_agents': execution.get('max_concurrent_agents', 3),
-            'default_timeout': execution.get('timeout_seconds', 3600),
-            'enable_parallel_execution': execution.get('enable_parallel_execution', True)
-        })
-        
-        # Tool settings
-        tools = eskai_config.get('tools', {})
-        flat_config.update({
-            'enable_internet': tools.get('enable_internet', True),
-            'enable_code_execution': tools.get('enable_code_execution', True),
-            'enable_file_operations': tools.get('enable_file_operations', True)
-        })
-        
-        # Logging settings
-        logging = eskai_config.get('logging', {})
-        flat_config.update({
-            'log_level': logging.get('level', 'INFO'),
-            'log_file': logging.get('file', 'eskai.log')
-        })
+        for section, source_key, target_field, default in _FILE_SCHEMA:
+            node = eskai_config
+            for part in section:
+                node = node.get(part) if isinstance(node, dict) else None
+            if isinstance(node, dict):
+                flat_config[target_field] = node.get(source_key, default)
         
         return cls(**flat_config)
     
@@ -118,58 +233,77 @@ class ESKAIConfig:
         Returns:
             Dictionary representation of the configuration
         """
-        return {
-            'openai_api_key': self.openai_api_key,
-            'groq_api_key': self.groq_api_key,
-            'gemini_api_key': self.gemini_api_key,
-            'openai_model': self.openai_model,
-            'groq_model': self.groq_model,
-            'gemini_model': self.gemini_model,
-            'temperature': self.temperature,
-            'max_concurrent_agents': self.max_concurrent_agents,
-            'enable_parallel_execution': self.enable_parallel_execution,
-            'default_timeout': self.default_timeout,
-            'enable_internet': self.enable_internet,
-            'enable_code_execution': self.enable_code_execution,
-            'enable_file_operations': self.enable_file_operations,
-            'log_level': self.log_level,
-            'log_file': self.log_file,
-            'max_tool_execution_time': self.max_tool_execution_time,
-            'sandbox_code_execution': self.sandbox_code_execution,
-            'max_file_size_mb': self.max_file_size_mb,
-            'retry_attempts': self.retry_attempts,
-            'retry_delay': self.retry_delay,
-            'cache_responses': self.cache_responses
-        }
+        return asdict(self)
+    
+    def __post_init__(self) -> None:
+        # Out-of-range settings fail at construction; API keys are checked by validate
+        self._validate_settings()
     
     def validate(self) -> None:
         """
         Validate the configuration settings.
         
+        Settings are also checked when the config is constructed; this
+        additionally requires an API key and re-checks fields assigned since.
+        
         Raises:
             ValueError: If configuration is invalid
         """
         if not self.openai_api_key and not self.groq_api_key and not self.gemini_api_key:
             raise ValueError("At least one API key must be provided")
         
+        self._validate_settings()
+    
+    def _validate_settings(self) -> None:
+        """Check that numeric settings are in range and the log level is known."""
         if self.max_concurrent_agents < 1:
             raise ValueError("max_concurrent_agents must be at least 1")
         
         if self.default_timeout < 60:
             raise ValueError("default_timeout must be at least 60 seconds")
         
+        if self.hedge_delay_ms < 0:
+            raise ValueError("hedge_delay_ms must not be negative")
+        
         if self.temperature < 0 or self.temperature > 2:
             raise ValueError("temperature must be between 0 and 2")
         
-        if self.log_level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
+        # Matched like ESKAILogger does, ignoring case
+        if self.log_level.upper() not in LOG_LEVELS:
             raise ValueError("log_level must be one of: DEBUG, INFO, WARNING, ERROR, CRITICAL")
 
 
+class _FrozenESKAIConfig(ESKAIConfig):
+    """
+    Read-only ESKAIConfig shared by get_default_config.
+    
+    Fields cannot be assigned after construction; derive a modified copy
+    (itself read-only) with dataclasses.replace(config, temperature=0.5).
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        object.__setattr__(self, "_frozen", True)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if getattr(self, "_frozen", False):
+            raise FrozenInstanceError(f"cannot assign to field {name!r} of the shared default config")
+        super().__setattr__(name, value)
+    
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r} of the shared default config")
+
+
+@lru_cache(maxsize=1)
 def get_default_config() -> ESKAIConfig:
     """
     Get the default ESKAI configuration.
     
+    The instance is built once, with the API keys found in the environment
+    at the first call, and shared by all callers, so it is read-only.
+    Construct ESKAIConfig() directly for a mutable configuration.
+    
     Returns:
-        Default ESKAIConfig instance
+        Shared, read-only default ESKAIConfig instance
     """
-    return ESKAIConfig()
+    return _FrozenESKAIConfig()
@@ -0,0 +1,67 @@
+"""
+Shared sentence embedding model for similarity features
+"""
+
+import importlib.util
+import threading
+from typing import Any, Dict, List, Union
+
+
+# Embedding model used when none is given; small and fast on CPU
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_encoders: Dict[str, Any] = {}
+_encoders_lock = threading.Lock()
+
+
+def embeddings_available() -> bool:
+    """
+    Check whether the optional embedding dependencies are installed.
+
+    Returns:
+        True if sentence-transformers and numpy can be imported
+    """
+    return (
+        importlib.util.find_spec("sentence_transformers") is not None
+        and importlib.util.find_spec("numpy") is not None
+    )
+
+
+def get_encoder(model_name: str = DEFAULT_EMBEDDING_MODEL) -> Any:
+    """
+    Get the process-wide encoder for a model, loading it on first use.
+
+    Loading a model takes hundreds of milliseconds and tens of megabytes,
+    so every caller shares one instance per model.
+
+    Args:
+        model_name: sentence-transformers model name
+
+    Returns:
+        Shared SentenceTransformer instance
+    """
+    with _encoders_lock:
+        encoder = _encoders.get(model_name)
+        if encoder is None:
+            from sentence_transformers import SentenceTransformer
+            encoder = _encoders[model_name] = SentenceTransformer(model_name)
+        return encoder
+
+
+def embed(texts: Union[str, List[str]], model_name: str = DEFAULT_EMBEDDING_MODEL) -> Any:
+    """
+    Embed one or more texts as unit-normalized vectors.
+
+    Args:
+        texts: Text, or list of texts encoded in batches
+        model_name: sentence-transformers model name
+
+    Returns:
+        Numpy vector for a single text, or matrix with one row per text
+    """
+    return get_encoder(model_name).encode(
+        texts,
+        normalize_embeddings=True,
+        batch_size=64,
+        convert_to_numpy=True
+    )
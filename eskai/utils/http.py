@@ -0,0 +1,55 @@
+"""
+Shared HTTP connection pool for provider SDK clients
+"""
+
+import atexit
+import importlib.util
+import threading
+from typing import Optional
+
+import httpx
+
+
+# Pool limits shared by every provider client in the process
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.Client:
+    """
+    Get the process-wide pooled HTTP client.
+    
+    Provider SDKs given this client reuse keep-alive connections across
+    requests and across ESKAI instances instead of each opening their own.
+    HTTP/2 is used when the optional h2 package is installed.
+    
+    Returns:
+        Shared httpx.Client instance
+    """
+    global _client
+    
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=httpx.Timeout(60.0, connect=10.0)
+            )
+        return _client
+
+
+@atexit.register
+def close_http_client() -> None:
+    """Close the shared HTTP client and its pooled connections."""
+    global _client
+    
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
@@ -0,0 +1,225 @@
+"""
+Response caching for LLM provider calls
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+
+# Responses sampled above this temperature are not reproducible enough to cache
+MAX_CACHEABLE_TEMPERATURE = 0.2
+
+
+class _ComputeAborted(Exception):
+    """Set on an in-flight future whose leader was cancelled or interrupted."""
+
+
+class LLMCache:
+    """
+    Thread-safe in-process LRU cache for LLM responses.
+    
+    Keys are derived from the model, system instruction, prompt and
+    generation parameters, so only byte-identical requests share an entry.
+    get_or_compute also coalesces concurrent identical requests, so only
+    one of them reaches the provider (single-flight).
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(model: str, prompt: str, system_instruction: str = "", **params: Any) -> str:
+        """
+        Build a cache key for a provider request.
+        
+        Args:
+            model: Model name
+            prompt: User prompt
+            system_instruction: System instruction sent with the prompt
+            **params: Generation parameters affecting the response
+        
+        Returns:
+            Hex digest identifying the request
+        """
+        params_json = json.dumps(params, sort_keys=True, default=str)
+        raw = f"{model}|{system_instruction}|{prompt}|{params_json}"
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def is_cacheable(temperature: Optional[float]) -> bool:
+        """
+        Check whether a response sampled at this temperature may be cached.
+        
+        Args:
+            temperature: Sampling temperature of the request
+        
+        Returns:
+            True if the response is deterministic enough to reuse
+        """
+        return temperature is not None and temperature <= MAX_CACHEABLE_TEMPERATURE
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+        
+        Args:
+            key: Cache key from make_key
+        
+        Returns:
+            Cached value or None on a miss
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if full.
+        
+        Args:
+            key: Cache key from make_key
+            value: Response text, or a result derived from responses
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached value, computing and storing it on a miss.
+        
+        If another thread is already computing the same key, this call waits
+        for that result (or exception) instead of computing it again. If that
+        computation is interrupted rather than failing, waiting callers claim
+        the key again, so one of them takes over.
+        
+        Args:
+            key: Cache key from make_key
+            compute: Callable producing the value, e.g. the provider request
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        while True:
+            value, inflight, is_leader = self._claim(key)
+            if inflight is None:
+                return value
+            if is_leader:
+                break
+            try:
+                return inflight.result()
+            except _ComputeAborted:
+                continue
+        
+        try:
+            value = compute()
+        except Exception as e:
+            self._release(key, inflight, error=e)
+            raise
+        except BaseException:
+            # Interrupted, not failed: let a waiting caller compute instead
+            self._release(key, inflight, error=_ComputeAborted())
+            raise
+        self._release(key, inflight, value=value)
+        return value
+    
+    async def aget_or_compute(self, key: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Asynchronous version of get_or_compute; compute returns an awaitable.
+        
+        Shares in-flight requests with get_or_compute, and waits for them
+        without blocking the event loop. A cancelled leader's CancelledError
+        is not passed on: waiting callers claim the key again instead.
+        """
+        while True:
+            value, inflight, is_leader = self._claim(key)
+            if inflight is None:
+                return value
+            if is_leader:
+                break
+            try:
+                # Shielded so cancelling this caller leaves the shared future alone
+                return await asyncio.shield(asyncio.wrap_future(inflight))
+            except _ComputeAborted:
+                continue
+        
+        try:
+            value = await compute()
+        except Exception as e:
+            self._release(key, inflight, error=e)
+            raise
+        except BaseException:
+            # Cancelled, not failed: let a waiting caller compute instead
+            self._release(key, inflight, error=_ComputeAborted())
+            raise
+        self._release(key, inflight, value=value)
+        return value
+    
+    def _claim(self, key: str) -> Tuple[Any, Optional[Future], bool]:
+        """
+        Look up a key for get_or_compute.
+        
+        Returns:
+            (cached value, None, False) on a hit, otherwise (None, in-flight
+            future, True if the caller must compute the value itself)
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value, None, False
+            
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self.hits += 1
+                return None, inflight, False
+            
+            self.misses += 1
+            inflight = self._inflight[key] = Future()
+            return None, inflight, True
+    
+    def _release(
+        self,
+        key: str,
+        inflight: Future,
+        value: Any = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Store a computed value and wake up callers waiting on it."""
+        if error is None:
+            self.set(key, value)
+        with self._lock:
+            self._inflight.pop(key, None)
+        if error is None:
+            inflight.set_result(value)
+        else:
+            inflight.set_exception(error)
+    
+    def clear(self) -> None:
+        """Remove all cached responses and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
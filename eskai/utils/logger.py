@@ -2,12 +2,26 @@
 Comprehensive logging system for ESKAI
 """
 
+import atexit
 import logging
+import logging.handlers
 import json
+import os
+import queue
+import threading
 import time
+from array import array
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+from types import ModuleType
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
 
 class ESKAIFormatter(logging.Formatter):
@@ -15,10 +29,25 @@ class ESKAIFormatter(logging.Formatter):
     Custom formatter for ESKAI logs with structured output.
     """
     
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Whole second of the last record and its ISO text; handlers format under a lock
+        self._last_second: Optional[int] = None
+        self._last_second_iso = ""
+    
+    def _timestamp(self, created: float) -> str:
+        """ISO 8601 local time with microseconds, reusing the per-second prefix."""
+        second = int(created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_second_iso = datetime.fromtimestamp(second).isoformat()
+        microsecond = min(round((created - second) * 1e6), 999999)
+        return f"{self._last_second_iso}.{microsecond:06d}"
+    
     def format(self, record):
         # Create structured log entry
         log_entry = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -41,7 +70,68 @@ class ESKAIFormatter(logging.Formatter):
         if tool_name is not None:
             log_entry['tool_name'] = tool_name
         
-        return json.dumps(log_entry, indent=None)
+        if orjson is not None:
+            text: str = orjson.dumps(log_entry, default=str).decode("utf-8")
+            return text
+        return json.dumps(log_entry, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+# Numeric value of each supported level name, for setup and config validation
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
+}
+
+# Numeric level for each ESKAILogger logging method
+_METHOD_LEVELS = {name.lower(): level for name, level in LOG_LEVELS.items()}
+
+# Console output is shared by every ESKAI logger; %(name)s identifies the source
+_CONSOLE_HANDLER = logging.StreamHandler()
+_CONSOLE_HANDLER.setFormatter(
+    logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+)
+
+# Log file path -> queue handler; one background writer thread per file
+_FILE_QUEUE_HANDLERS: Dict[str, logging.handlers.QueueHandler] = {}
+_FILE_QUEUE_HANDLERS_LOCK = threading.Lock()
+
+
+def _file_queue_handler(log_file: str) -> logging.handlers.QueueHandler:
+    """
+    Get the queue handler writing records to a log file.
+    
+    Records are JSON-formatted and written by a QueueListener thread, so
+    logging calls only enqueue them. The listener is stopped at exit,
+    after flushing queued records.
+    
+    Args:
+        log_file: Log file path
+        
+    Returns:
+        QueueHandler shared by every logger writing to log_file
+    """
+    log_path = os.path.abspath(log_file)
+    
+    with _FILE_QUEUE_HANDLERS_LOCK:
+        queue_handler = _FILE_QUEUE_HANDLERS.get(log_path)
+        if queue_handler is None:
+            Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+            
+            file_handler = logging.FileHandler(log_path, encoding="utf-8")
+            file_handler.setFormatter(ESKAIFormatter())
+            
+            records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            listener = logging.handlers.QueueListener(records, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            
+            queue_handler = _FILE_QUEUE_HANDLERS[log_path] = logging.handlers.QueueHandler(records)
+        return queue_handler
 
 
 class ESKAILogger:
@@ -51,28 +141,17 @@ class ESKAILogger:
     
     def __init__(self, name: str, level: str = "INFO", log_file: Optional[str] = None):
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(getattr(logging, level.upper()))
+        self.logger.setLevel(LOG_LEVELS[level.upper()])
         
-        # Clear existing handlers
-        self.logger.handlers.clear()
-        
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(
-            logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-        )
-        self.logger.addHandler(console_handler)
+        # Shared console handler, attached once per underlying logger
+        if _CONSOLE_HANDLER not in self.logger.handlers:
+            self.logger.addHandler(_CONSOLE_HANDLER)
         
-        # File handler if specified
+        # Background file output if specified and not already attached
         if log_file:
-            log_path = Path(log_file)
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(ESKAIFormatter())
-            self.logger.addHandler(file_handler)
+            file_queue_handler = _file_queue_handler(log_file)
+            if file_queue_handler not in self.logger.handlers:
+                self.logger.addHandler(file_queue_handler)
         
         self.context = {}
     
@@ -84,40 +163,51 @@ class ESKAILogger:
         """Clear the current context."""
         self.context = {}
     
-    def _log_with_context(self, level, message, **kwargs):
+    def _log_with_context(self, level, message, *args, **kwargs):
         """Log message with current context."""
-        extra = {**self.context, **kwargs}
-        getattr(self.logger, level)(message, extra=extra)
+        # Skip the context merge entirely for records that would be dropped
+        level_number = _METHOD_LEVELS[level]
+        if not self.logger.isEnabledFor(level_number):
+            return
+        # Without a context the per-call fields are passed through uncopied
+        extra = {**self.context, **kwargs} if self.context else kwargs
+        self.logger.log(level_number, message, *args, extra=extra)
     
-    def debug(self, message, **kwargs):
-        """Log debug message."""
-        self._log_with_context('debug', message, **kwargs)
+    def debug(self, message, *args, **kwargs):
+        """Log debug message, %-formatting it with args only if it is emitted."""
+        self._log_with_context('debug', message, *args, **kwargs)
     
-    def info(self, message, **kwargs):
-        """Log info message."""
-        self._log_with_context('info', message, **kwargs)
+    def info(self, message, *args, **kwargs):
+        """Log info message, %-formatting it with args only if it is emitted."""
+        self._log_with_context('info', message, *args, **kwargs)
     
-    def warning(self, message, **kwargs):
-        """Log warning message."""
-        self._log_with_context('warning', message, **kwargs)
+    def warning(self, message, *args, **kwargs):
+        """Log warning message, %-formatting it with args only if it is emitted."""
+        self._log_with_context('warning', message, *args, **kwargs)
     
-    def error(self, message, **kwargs):
-        """Log error message."""
-        self._log_with_context('error', message, **kwargs)
+    def error(self, message, *args, **kwargs):
+        """Log error message, %-formatting it with args only if it is emitted."""
+        self._log_with_context('error', message, *args, **kwargs)
     
-    def critical(self, message, **kwargs):
-        """Log critical message."""
-        self._log_with_context('critical', message, **kwargs)
+    def critical(self, message, *args, **kwargs):
+        """Log critical message, %-formatting it with args only if it is emitted."""
+        self._log_with_context('critical', message, *args, **kwargs)
 
 
-# Global logger cache
-_loggers: Dict[str, ESKAILogger] = {}
+# Global LRU logger cache; the lock keeps concurrent first calls from racing handler setup
+_loggers: "OrderedDict[Tuple[str, str, Optional[str]], ESKAILogger]" = OrderedDict()
+_loggers_lock = threading.Lock()
+_MAX_LOGGERS = 64
 
 
 def get_logger(name: str, level: str = "INFO", log_file: Optional[str] = None) -> ESKAILogger:
     """
     Get or create a logger instance.
     
+    At most _MAX_LOGGERS instances are cached. Evicting one only drops the
+    cache entry: its handlers are shared with other loggers and stay open,
+    and callers still holding it can keep logging.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -126,12 +216,18 @@ def get_logger(name: str, level: str = "INFO", log_file: Optional[str] = None) -
     Returns:
         ESKAILogger instance
     """
-    logger_key = f"{name}_{level}_{log_file}"
+    logger_key = (name, level, log_file)
     
-    if logger_key not in _loggers:
-        _loggers[logger_key] = ESKAILogger(name, level, log_file)
+    with _loggers_lock:
+        logger = _loggers.get(logger_key)
+        if logger is None:
+            logger = _loggers[logger_key] = ESKAILogger(name, level, log_file)
+            while len(_loggers) > _MAX_LOGGERS:
+                _loggers.popitem(last=False)
+        else:
+            _loggers.move_to_end(logger_key)
     
-    return _loggers[logger_key]
+    return logger
 
 
 class ExecutionTracker:
@@ -142,18 +238,38 @@ class ExecutionTracker:
     def __init__(self, execution_id: str):
         self.execution_id = execution_id
         self.start_time = time.time()
-        self.events = []
+        self.start_ns = time.monotonic_ns()
         self.metrics = {}
+        
+        # Events are stored column-wise and only turned into dicts on request;
+        # timestamps are monotonic_ns readings, converted to epoch seconds then
+        self._timestamps = array("q")
+        self._types: List[str] = []
+        self._descriptions: List[str] = []
+        self._data: List[Dict[str, Any]] = []
     
     def log_event(self, event_type: str, description: str, **kwargs):
         """Log an execution event."""
-        event = {
-            "timestamp": time.time(),
-            "type": event_type,
-            "description": description,
-            "data": kwargs
-        }
-        self.events.append(event)
+        self._timestamps.append(time.monotonic_ns())
+        self._types.append(event_type)
+        self._descriptions.append(description)
+        self._data.append(kwargs)
+    
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Logged events as dicts with timestamp, type, description and data."""
+        start_time, start_ns = self.start_time, self.start_ns
+        return [
+            {
+                "timestamp": start_time + (timestamp - start_ns) / 1e9,
+                "type": event_type,
+                "description": description,
+                "data": data
+            }
+            for timestamp, event_type, description, data in zip(
+                self._timestamps, self._types, self._descriptions, self._data
+            )
+        ]
     
     def set_metric(self, name: str, value: Any):
         """Set a performance metric."""
@@ -161,14 +277,14 @@ class ExecutionTracker:
     
     def get_duration(self) -> float:
         """Get total execution duration."""
-        return time.time() - self.start_time
+        return (time.monotonic_ns() - self.start_ns) / 1e9
     
     def get_summary(self) -> Dict[str, Any]:
         """Get execution summary."""
         return {
             "execution_id": self.execution_id,
             "duration": self.get_duration(),
-            "events_count": len(self.events),
+            "events_count": len(self._types),
             "metrics": self.metrics,
             "events": self.events
         }
@@ -0,0 +1,91 @@
+"""
+Retry with exponential backoff for transient provider errors
+"""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from .logger import ESKAILogger
+
+
+# Upper bound on a single backoff sleep, in seconds
+MAX_RETRY_DELAY = 30.0
+
+T = TypeVar("T")
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    should_retry: Callable[[Exception], bool],
+    retry_attempts: int = 3,
+    retry_delay: float = 1.0,
+    logger: Optional[ESKAILogger] = None
+) -> T:
+    """
+    Call func, retrying transient failures with exponential backoff.
+
+    Each sleep is drawn uniformly from [0, retry_delay * 2**attempt] (capped at
+    MAX_RETRY_DELAY), so clients throttled together do not retry in lockstep.
+
+    Args:
+        func: Zero-argument callable performing the request
+        should_retry: Predicate telling whether an error is transient
+        retry_attempts: Retries allowed after the first attempt
+        retry_delay: Base delay in seconds
+        logger: Optional logger for retry warnings
+
+    Returns:
+        Result of func
+
+    Raises:
+        The last error once retries are exhausted, or any non-transient error
+    """
+    attempt = 0
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            if attempt >= retry_attempts or not should_retry(e):
+                raise
+
+            attempt += 1
+            time.sleep(_backoff(attempt, retry_attempts, retry_delay, e, logger))
+
+
+async def acall_with_retry(
+    func: Callable[[], Awaitable[T]],
+    should_retry: Callable[[Exception], bool],
+    retry_attempts: int = 3,
+    retry_delay: float = 1.0,
+    logger: Optional[ESKAILogger] = None
+) -> T:
+    """Asynchronous version of call_with_retry; func returns an awaitable."""
+    attempt = 0
+    while True:
+        try:
+            return await func()
+        except Exception as e:
+            if attempt >= retry_attempts or not should_retry(e):
+                raise
+
+            attempt += 1
+            await asyncio.sleep(_backoff(attempt, retry_attempts, retry_delay, e, logger))
+
+
+def _backoff(
+    attempt: int,
+    retry_attempts: int,
+    retry_delay: float,
+    error: Exception,
+    logger: Optional[ESKAILogger]
+) -> float:
+    """Pick the jittered delay before the given retry and log it."""
+    delay = random.uniform(0, min(MAX_RETRY_DELAY, retry_delay * 2 ** (attempt - 1)))
+    if logger is not None:
+        logger.warning(
+            "Transient provider error, retry %d/%d in %.2fs: %s",
+            attempt, retry_attempts, delay, error
+        )
+    return delay
@@ -0,0 +1,58 @@
+"""
+Dependency-aware batching of agents and workflow steps
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .logger import ESKAILogger
+
+
+def dependency_batches(
+    items: List[Dict[str, Any]],
+    id_key: str,
+    logger: Optional[ESKAILogger] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    Group items into dependency phases using a topological sort.
+
+    Each phase holds every item whose dependencies all ran in earlier
+    phases, so phases run in order and items within a phase are
+    independent (Kahn's algorithm). Items keep their input order within a
+    phase. Dependencies on unknown items are ignored. If a cycle remains,
+    the first item with the fewest unfinished dependencies is run on its
+    own to break it.
+
+    Args:
+        items: Agent or step specifications with a "dependencies" list
+        id_key: Key holding each item's identifier, e.g. "agent_id"
+        logger: Optional logger for cycle warnings
+
+    Returns:
+        List of item batches
+    """
+    item_ids = {item[id_key] for item in items}
+    pending = {
+        item[id_key]: set(item.get("dependencies") or []) & item_ids
+        for item in items
+    }
+
+    batches = []
+    remaining = list(items)
+
+    while remaining:
+        batch = [item for item in remaining if not pending[item[id_key]]]
+
+        if not batch:
+            # Dependency cycle: release the least blocked item
+            batch = [min(remaining, key=lambda item: len(pending[item[id_key]]))]
+            if logger is not None:
+                logger.warning("Dependency cycle detected, running %s early", batch[0][id_key])
+
+        batch_ids = {item[id_key] for item in batch}
+        remaining = [item for item in remaining if item[id_key] not in batch_ids]
+        for item in remaining:
+            pending[item[id_key]] -= batch_ids
+
+        batches.append(batch)
+
+    return batches
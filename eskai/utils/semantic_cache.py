@@ -0,0 +1,115 @@
+"""
+Similarity-based response caching for LLM provider calls
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .embedding import DEFAULT_EMBEDDING_MODEL, embed, embeddings_available
+
+
+class SemanticCache:
+    """
+    Thread-safe in-process cache matching prompts by embedding similarity.
+    
+    Unlike LLMCache, a prompt hits when it is close enough to an earlier one
+    (cosine similarity at or above the threshold), so near-duplicate,
+    templated prompts share a response. Entries are grouped by a namespace
+    (model, system instruction and generation parameters) and only prompts
+    within the same namespace are compared.
+    
+    Requires the optional sentence-transformers package; see is_available.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        max_entries: int = 1024,
+        model_name: str = DEFAULT_EMBEDDING_MODEL
+    ):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[str, Tuple[List[Any], List[str]]] = {}
+        self._order: Deque[str] = deque()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether the optional embedding dependencies are installed."""
+        return embeddings_available()
+    
+    def embed(self, prompt: str) -> Any:
+        """
+        Embed a prompt with the shared encoder (see get_encoder).
+        
+        Args:
+            prompt: Prompt text
+        
+        Returns:
+            Unit-normalized embedding vector
+        """
+        return embed(prompt, self.model_name)
+    
+    def get(self, namespace: str, embedding: Any) -> Optional[str]:
+        """
+        Look up the response of the most similar cached prompt.
+        
+        Args:
+            namespace: Request namespace, e.g. from LLMCache.make_key
+            embedding: Prompt embedding from embed
+        
+        Returns:
+            Cached response, or None if no prompt is similar enough
+        """
+        import numpy as np
+        
+        with self._lock:
+            vectors, responses = self._entries.get(namespace, ((), ()))
+            if vectors:
+                # Embeddings are normalized, so the dot product is the cosine
+                scores = np.stack(vectors) @ embedding
+                best = int(scores.argmax())
+                if scores[best] >= self.threshold:
+                    self.hits += 1
+                    return responses[best]
+            
+            self.misses += 1
+            return None
+    
+    def set(self, namespace: str, embedding: Any, response: str) -> None:
+        """
+        Store a response, evicting the oldest entry if full.
+        
+        Args:
+            namespace: Request namespace, e.g. from LLMCache.make_key
+            embedding: Prompt embedding from embed
+            response: Response text
+        """
+        with self._lock:
+            vectors, responses = self._entries.setdefault(namespace, ([], []))
+            vectors.append(embedding)
+            responses.append(response)
+            self._order.append(namespace)
+            
+            while len(self._order) > self.max_entries:
+                oldest = self._order.popleft()
+                oldest_vectors, oldest_responses = self._entries[oldest]
+                del oldest_vectors[0]
+                del oldest_responses[0]
+                if not oldest_vectors:
+                    del self._entries[oldest]
+    
+    def clear(self) -> None:
+        """Remove all cached responses and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._order)
@@ -0,0 +1,151 @@
+"""
+JSON serialization helpers with an optional orjson fast path
+"""
+
+import json
+import re
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Union
+
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+# A fenced ```json ... ``` (or bare ```) block, as LLMs often wrap JSON replies
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Shared decoder for pulling a JSON object out of surrounding prose
+_DECODER = json.JSONDecoder()
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Uses orjson when installed and falls back to the standard library.
+    Values that are not JSON-native are converted with str().
+    
+    Args:
+        obj: Object to serialize
+        indent: Whether to pretty-print with two-space indentation
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        text: str = orjson.dumps(obj, option=option, default=str).decode("utf-8")
+        return text
+    
+    return json.dumps(obj, indent=2 if indent else None, default=str)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text
+        
+    Returns:
+        Parsed object
+        
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    
+    return json.loads(data)
+
+
+def dumps_joined(items: List[Any], separator: str = "\n---\n") -> str:
+    """
+    Serialize each item compactly and join the results in one pass.
+    
+    Used to embed lists of records in prompts without the repr() of the
+    whole list, which is larger and must be rebuilt for every prompt.
+    
+    Args:
+        items: Objects to serialize
+        separator: Text placed between serialized items
+        
+    Returns:
+        Joined JSON documents
+    """
+    return separator.join([dumps(item) for item in items])
+
+
+def strip_code_fence(text: str) -> str:
+    """
+    Extract the body of the first fenced code block in an LLM response.
+    
+    Args:
+        text: Raw response text
+        
+    Returns:
+        The fenced block's content, or the text unchanged if there is none
+    """
+    match = _JSON_FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse the first JSON object embedded in an LLM response.
+    
+    Decoding starts at the first '{' and stops at the end of that object,
+    so trailing prose or further objects are ignored. Replies that end
+    with the object, the common case, are parsed with orjson when it is
+    installed.
+    
+    Args:
+        text: Response text, usually after strip_code_fence
+        
+    Returns:
+        The parsed object, or None if the text contains no '{'
+        
+    Raises:
+        ValueError: If the text at the first '{' is not valid JSON
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+    
+    if orjson is not None and text.rstrip().endswith("}"):
+        try:
+            parsed: Dict[str, Any] = orjson.loads(text[start:])
+            return parsed
+        except orjson.JSONDecodeError:
+            pass  # Further text after the object; let raw_decode find its end
+    
+    result: Dict[str, Any] = _DECODER.raw_decode(text, start)[0]
+    return result
+
+
+def extract_json_array(text: str) -> Optional[List[Any]]:
+    """
+    Parse the first JSON array embedded in an LLM response.
+    
+    Array counterpart of extract_json_object.
+    
+    Args:
+        text: Response text, usually after strip_code_fence
+        
+    Returns:
+        The parsed array, or None if the text contains no '['
+        
+    Raises:
+        ValueError: If the text at the first '[' is not valid JSON
+    """
+    start = text.find("[")
+    if start < 0:
+        return None
+    
+    result: List[Any] = _DECODER.raw_decode(text, start)[0]
+    return result
@@ -5,6 +5,7 @@ Test configuration and fixtures
 import pytest
 import os
 import sys
+from contextlib import ExitStack
 from pathlib import Path
 from unittest.mock import patch
 from eskai import ESKAIConfig
@@ -13,9 +14,9 @@ from eskai import ESKAIConfig
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_config():
-    """Provide a test configuration"""
+    """Provide a test configuration shared by all tests; derive variants with dataclasses.replace"""
     return ESKAIConfig(
         openai_api_key="test-openai-key",
         groq_api_key="test-groq-key", 
@@ -26,12 +27,20 @@ def test_config():
     )
 
 
+# Provider classes replaced by mock_providers
+PROVIDER_PATCH_TARGETS = (
+    'eskai.providers.openai_client.OpenAI',
+    'eskai.providers.groq_client.GroqClient',
+    'eskai.providers.gemini_client.GeminiClient'
+)
+
+
 @pytest.fixture
 def mock_providers():
     """Mock all AI providers"""
-    with patch('eskai.providers.openai_client.OpenAI'), \
-         patch('eskai.providers.groq_client.GroqClient'), \
-         patch('eskai.providers.gemini_client.GeminiClient'):
+    with ExitStack() as stack:
+        for target in PROVIDER_PATCH_TARGETS:
+            stack.enter_context(patch(target))
         yield
 
 
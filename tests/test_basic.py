@@ -95,6 +95,23 @@ class TestConfig:
         config.max_concurrent_agents = 0
         with pytest.raises(ValueError):
             config.validate()
+    
+    def test_invalid_settings_fail_at_construction(self):
+        """Test out-of-range settings are rejected when the config is built"""
+        with pytest.raises(ValueError):
+            ESKAIConfig(max_concurrent_agents=0)
+        with pytest.raises(ValueError):
+            ESKAIConfig(log_level="LOUD")
+    
+    def test_from_file_reloads_changed_file(self, tmp_path):
+        """Test repeated loads see edits to the configuration file"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text("eskai:\n  execution:\n    max_concurrent_agents: 5\n")
+        assert ESKAIConfig.from_file(str(config_path)).max_concurrent_agents == 5
+        assert ESKAIConfig.from_file(str(config_path)).max_concurrent_agents == 5
+        
+        config_path.write_text("eskai:\n  execution:\n    max_concurrent_agents: 12\n")
+        assert ESKAIConfig.from_file(str(config_path)).max_concurrent_agents == 12
 
 
 if __name__ == "__main__":
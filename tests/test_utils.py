@@ -0,0 +1,224 @@
+"""
+Tests for ESKAI utilities
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the parent directory to the path so we can import eskai
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from eskai.providers.provider_manager import ProviderManager
+from eskai.utils.llm_cache import LLMCache
+from eskai.utils.retry import call_with_retry
+from eskai.utils.scheduling import dependency_batches
+from eskai.utils.serialization import dumps_joined, extract_json_array, extract_json_object, loads
+
+
+class TestLLMCache:
+    """Test cases for the LLM response cache"""
+    
+    def test_hit_and_miss(self):
+        """Test cached responses are returned for identical requests only"""
+        cache = LLMCache()
+        key = cache.make_key("gpt-4o-mini", "Classify this", temperature=0.1)
+        
+        assert cache.get(key) is None
+        cache.set(key, "objective")
+        assert cache.get(key) == "objective"
+        assert cache.get(cache.make_key("gpt-4o-mini", "Classify this", temperature=0.0)) is None
+        assert cache.hits == 1
+        assert cache.misses == 2
+    
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first"""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert len(cache) == 2
+    
+    def test_temperature_gate(self):
+        """Test only low temperature responses are cacheable"""
+        assert LLMCache.is_cacheable(0.1)
+        assert not LLMCache.is_cacheable(0.7)
+        assert not LLMCache.is_cacheable(None)
+    
+    def test_get_or_compute_coalesces(self):
+        """Test concurrent identical requests share a single computation"""
+        cache = LLMCache()
+        calls = []
+        lock = threading.Lock()
+        
+        def compute():
+            with lock:
+                calls.append(1)
+            time.sleep(0.05)
+            return "objective"
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: cache.get_or_compute("k", compute), range(8)))
+        
+        assert results == ["objective"] * 8
+        assert len(calls) == 1
+        assert cache.get_or_compute("k", compute) == "objective"
+        assert len(calls) == 1
+    
+    def test_cancelled_leader_hands_over(self):
+        """Test waiters of a cancelled async computation take it over instead of being cancelled"""
+        cache = LLMCache()
+        calls = []
+        
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return f"objective {len(calls)}"
+        
+        async def scenario():
+            leader = asyncio.create_task(cache.aget_or_compute("k", compute))
+            await asyncio.sleep(0.01)
+            followers = [asyncio.create_task(cache.aget_or_compute("k", compute)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            return leader, await asyncio.gather(*followers)
+        
+        leader, results = asyncio.run(scenario())
+        
+        assert leader.cancelled()
+        assert results == ["objective 2", "objective 2"]
+        assert len(calls) == 2
+
+
+class TestSerialization:
+    """Test cases for the JSON helpers"""
+    
+    def test_extract_json_object(self):
+        """Test the first embedded object is parsed and trailing prose ignored"""
+        text = 'Result: {"intent": "chat", "reasoning": "a {b}"} Let me know {if} needed.'
+        
+        assert extract_json_object(text) == {"intent": "chat", "reasoning": "a {b}"}
+        assert extract_json_object("no json here") is None
+    
+    def test_extract_json_array(self):
+        """Test the first embedded array is parsed and trailing prose ignored"""
+        text = 'Here you go: [{"intent": "chat"}, {"intent": "objective"}] Hope [this] helps.'
+        
+        assert extract_json_array(text) == [{"intent": "chat"}, {"intent": "objective"}]
+        assert extract_json_array("no json here") is None
+    
+    def test_dumps_joined(self):
+        """Test each item is serialized on its own and joined by the separator"""
+        joined = dumps_joined([{"agent_id": "a"}, {"agent_id": "b"}])
+        
+        assert [loads(part) for part in joined.split("\n---\n")] == [{"agent_id": "a"}, {"agent_id": "b"}]
+        assert dumps_joined([]) == ""
+
+
+class TestRetry:
+    """Test cases for provider retry backoff"""
+    
+    def test_retries_transient_errors_only(self):
+        """Test transient errors are retried until the attempts run out"""
+        calls = []
+        
+        def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise ConnectionError("reset")
+            return "ok"
+        
+        assert call_with_retry(flaky, lambda e: isinstance(e, ConnectionError), retry_delay=0) == "ok"
+        assert len(calls) == 3
+        
+        calls.clear()
+        with pytest.raises(ConnectionError):
+            call_with_retry(flaky, lambda e: isinstance(e, ConnectionError), retry_attempts=1, retry_delay=0)
+        assert len(calls) == 2
+        
+        with pytest.raises(ValueError):
+            call_with_retry(lambda: int("x"), lambda e: isinstance(e, ConnectionError), retry_delay=0)
+
+
+class StubClient:
+    """Provider client answering every prompt, recording the order of the calls"""
+    
+    calls = []
+    
+    def __init__(self, **kwargs):
+        pass
+    
+    def generate_response(self, prompt, **kwargs):
+        StubClient.calls.append(prompt)
+        return f"done: {prompt}"
+
+
+class TestWorkflow:
+    """Test cases for dependency-ordered workflow execution"""
+    
+    def test_workflow_steps_layouts(self):
+        """Test steps are normalized from both the Groq and the Gemini workflow layouts"""
+        groq_workflow = {"steps": [
+            {"step_id": 1, "action": "Research topic", "dependencies": []},
+            {"step_id": 2, "action": "Write report", "dependencies": [1]}
+        ]}
+        gemini_workflow = {"steps": [
+            {"id": "collect", "description": "Collect sources"},
+            {"id": "summarize", "description": "Summarize sources", "dependencies": ["collect"]}
+        ]}
+        
+        assert ProviderManager._workflow_steps(groq_workflow) == [
+            {"step_id": "1", "prompt": "Research topic", "dependencies": []},
+            {"step_id": "2", "prompt": "Write report", "dependencies": ["1"]}
+        ]
+        assert ProviderManager._workflow_steps(gemini_workflow) == [
+            {"step_id": "collect", "prompt": "Collect sources", "dependencies": []},
+            {"step_id": "summarize", "prompt": "Summarize sources", "dependencies": ["collect"]}
+        ]
+        with pytest.raises(ValueError):
+            ProviderManager._workflow_steps({"steps": [{"step_id": 1, "agent_type": "research"}]})
+    
+    def test_run_workflow_orders_dependencies(self, test_config):
+        """Test each step runs only after the steps it depends on"""
+        config = replace(test_config, groq_api_key="", gemini_api_key="")
+        workflow = {"steps": [
+            {"step_id": 1, "action": "Write report", "dependencies": [2, 3]},
+            {"step_id": 2, "action": "Research market", "dependencies": []},
+            {"step_id": 3, "action": "Research competitors", "dependencies": []}
+        ]}
+        StubClient.calls = []
+        
+        with patch("eskai.providers.openai_client.OpenAIClient", StubClient):
+            results = ProviderManager(config).run_workflow(workflow)
+        
+        assert results == {
+            "1": "done: Write report",
+            "2": "done: Research market",
+            "3": "done: Research competitors"
+        }
+        assert StubClient.calls[-1] == "Write report"
+    
+    def test_dependency_batches_breaks_cycles(self):
+        """Test independent items share a batch and a cycle is broken instead of stalling"""
+        items = [
+            {"agent_id": "a", "dependencies": ["c"]},
+            {"agent_id": "b", "dependencies": []},
+            {"agent_id": "c", "dependencies": ["a"]},
+            {"agent_id": "d", "dependencies": ["missing"]}
+        ]
+        
+        batches = [[item["agent_id"] for item in batch] for batch in dependency_batches(items, "agent_id")]
+        
+        assert batches == [["b", "d"], ["a"], ["c"]]